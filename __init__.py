@@ -1,3 +1,26 @@
-from zmath.fraction import Fraction
+import importlib
 
-__all__ = ["Fraction"]
+# Submodules are imported on first attribute access, so that
+# "import zmath" stays cheap for short-lived processes.
+_submodules = ("algebra", "bases", "combinatorics", "conversions",
+               "coordinate", "core", "divisibility", "expression",
+               "factorization", "fraction", "fractionarray", "geometry",
+               "linear_algebra", "numbers", "primality", "primecount",
+               "primestore", "probability", "roots", "sequences", "sieve",
+               "stats", "trig")
+
+__all__ = ["Fraction", *_submodules]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    if name == "Fraction":
+        from zmath.fraction import Fraction
+        return Fraction
+    raise AttributeError("module {!r} has no attribute {!r}"
+                         .format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
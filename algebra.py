@@ -1,4 +1,4 @@
-from zmath.fraction import Fraction, floatfrac, subscripts, superscripts
+from zmath.fraction import floatfrac, subscripts, superscripts
 
 
 class Polynomial:
@@ -33,7 +33,7 @@ class Polynomial:
                     expr.append(' + ' if c > 0 else ' - ')
                     c = abs(c)
                 exp = length - i - 1
-                expr.append(Fraction(c * exp))
+                expr.append(floatfrac(c * exp))
                 if exp > 1:
                     expr.append('x')
                     if exp > 2:
@@ -53,7 +53,7 @@ class Polynomial:
                 if i > 0:
                     expr.append('+' if c > 0 else '-')
                     c = abs(c)
-                coef = str(c) + ' * ' if foreval else Fraction(c)
+                coef = str(c) + ' * ' if foreval else floatfrac(c)
                 exponent = length - i - 1
                 exp = str(exponent)
                 term = "{}x{}" if int(exp) > 1 else "{}x"
@@ -1,17 +1,14 @@
-from structures.stacks import Stack
-
-
 def base_converter(decimal, base, formatted=False):
     number = decimal
     digits = "0123456789ABCDEF"
-    rem_stack = Stack()
+    rem_stack = []
     bits = decimal // 256 + 1
     while decimal > 0:
         rem = decimal % base
-        rem_stack.push(rem)
+        rem_stack.append(rem)
         decimal //= base
     new_str = ""
-    while not rem_stack.isempty():
+    while rem_stack:
         new_str += digits[rem_stack.pop()]
 
     if not formatted:
@@ -35,10 +32,10 @@ def hex_to_rgb(value):
 
 
 if __name__ == "__main__":
-    from list_functions import product
+    from zmath.core import prod
     print(hex_to_rgb("ffffff"))
     mylist = [1, 2, 3, 4, 5, 6, 7]
-    print(product(mylist, 1, 3))
+    print(prod(mylist, 1, 3))
     print(base_converter(128, 16))
     # print(base_converter(255, 16))
     # print(base_converter(255, 16))
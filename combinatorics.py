@@ -0,0 +1,150 @@
+import math
+from functools import lru_cache
+from zmath.sieve import Sieve
+
+_sieve = None  # built on first use, so importing stays cheap
+
+
+def _primes(n):
+    """Return the primes up to n, growing the shared sieve as needed."""
+    global _sieve
+    if _sieve is None or n > _sieve.limit:
+        limit = 1 << 16 if _sieve is None else 2 * _sieve.limit
+        _sieve = Sieve(max(n, limit))
+    return list(_sieve.primes(2, n + 1))
+
+
+def _check(n):
+    if isinstance(n, float) and n.is_integer():
+        n = int(n)
+    if not isinstance(n, int):
+        raise TypeError("expected an integer, got " + str(type(n)))
+    if n < 0:
+        raise ValueError("expected a non-negative integer")
+    return n
+
+
+def product(values, lo=0, hi=None):
+    """Return the product of values[lo:hi] by binary splitting, which
+    keeps the operands of each multiplication balanced."""
+    hi = len(values) if hi is None else hi
+    if hi - lo <= 8:
+        res = 1
+        for i in range(lo, hi):
+            res *= values[i]
+        return res
+    mid = (lo + hi) // 2
+    return product(values, lo, mid) * product(values, mid, hi)
+
+
+def falling(n, k):
+    """Return the falling factorial n (n - 1) ... (n - k + 1)."""
+    n, k = _check(n), _check(k)
+    if k > n:
+        return 0
+    return product(range(n - k + 1, n + 1))
+
+
+def _swing_odd(n, primes):
+    """Return the odd part of the swinging factorial n! / (n // 2)!^2."""
+    factors = []
+    root = math.isqrt(n)
+    for p in primes:
+        if p > n:
+            break
+        if p == 2:
+            continue
+        if 2 * p > n:
+            factors.append(p)
+        elif p > root:
+            if n // p & 1:
+                factors.append(p)
+        else:
+            q, pw = n, 1
+            while q:
+                q //= p
+                if q & 1:
+                    pw *= p
+            if pw > 1:
+                factors.append(pw)
+    return product(factors)
+
+
+def _odd_factorial(n, primes):
+    if n < 2:
+        return 1
+    return _odd_factorial(n // 2, primes) ** 2 * _swing_odd(n, primes)
+
+
+def factorial(n):
+    """Return n! with Luschny's prime swing algorithm."""
+    n = _check(n)
+    if n < 20:
+        return product(range(2, n + 1))
+    odd = _odd_factorial(n, _primes(n))
+    return odd << (n - bin(n).count('1'))
+
+
+def binomial(n, k):
+    """Return the binomial coefficient C(n, k), built from the prime
+    factorization given by Kummer's theorem rather than factorials."""
+    n, k = _check(n), _check(k)
+    if k > n:
+        return 0
+    k = min(k, n - k)
+    if k < 32:
+        return falling(n, k) // product(range(2, k + 1))
+    factors = []
+    for p in _primes(n):
+        if p > n - k:
+            factors.append(p)
+            continue
+        if 2 * p > n:
+            continue
+        e, pn, pk, pnk = 0, n, k, n - k
+        while pn:
+            pn, pk, pnk = pn // p, pk // p, pnk // p
+            e += pn - pk - pnk
+        if e:
+            factors.append(p ** e)
+    return product(factors)
+
+
+@lru_cache(maxsize=32)
+def _factorials_mod(p):
+    """Return tables of i! and 1 / i! mod p for 0 <= i < p."""
+    fact = [1] * p
+    for i in range(1, p):
+        fact[i] = fact[i - 1] * i % p
+    inv = [1] * p
+    inv[p - 1] = pow(fact[p - 1], p - 2, p)
+    for i in range(p - 1, 0, -1):
+        inv[i - 1] = inv[i] * i % p
+    return fact, inv
+
+
+def binomial_mod(n, k, p, table_limit=1 << 16):
+    """
+    Return C(n, k) mod p using Lucas' theorem
+    :param p: prime modulus
+    :param table_limit: cache factorial tables for primes below this
+    """
+    n, k = _check(n), _check(k)
+    if k > n:
+        return 0
+    res = 1
+    while k and res:
+        ni, ki = n % p, k % p
+        if ki > ni:
+            return 0
+        if p < table_limit:
+            fact, inv = _factorials_mod(p)
+            res = res * fact[ni] * inv[ki] * inv[ni - ki] % p
+        else:
+            num = den = 1
+            for i in range(min(ki, ni - ki)):
+                num = num * (ni - i) % p
+                den = den * (i + 1) % p
+            res = res * num * pow(den, p - 2, p) % p
+        n, k = n // p, k // p
+    return res % p
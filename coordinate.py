@@ -1,5 +1,5 @@
 import math
-from zmath.fraction import Fraction
+from zmath.fraction import floatfrac
 
 
 class Coordinate:
@@ -17,26 +17,26 @@ class Coordinate:
         x_diff_sq = (self.x - other.x)**2
         y_diff_sq = (self.y - other.y)**2
         distance = round(math.sqrt(x_diff_sq + y_diff_sq), 2)
-        return Fraction(distance).__str__(True)
+        return floatfrac(distance).__str__(True)
 
     def midpoint(self, other):
         x_value = (self.x - other.x)/2
         y_value = (self.y - other.y)/2
-        midpoint = (Fraction(x_value).__str__(True),
-                    Fraction(y_value).__str__(True))
+        midpoint = (floatfrac(x_value).__str__(True),
+                    floatfrac(y_value).__str__(True))
         return midpoint
 
     def slope(self, other):
         rise = self.y - other.y
         run = self.x - other.x
         slope = rise / run
-        return Fraction(slope)
+        return floatfrac(slope)
 
     def intercepts(self, other):
         m = self.slope(other)
         y_intercept = round((self.y - (m * self.x)), 2)
         x_intercept = round(((0 - y_intercept) / m), 2)
-        return (str(Fraction(x_intercept)), 0), (0, str(Fraction(y_intercept)))
+        return (str(floatfrac(x_intercept)), 0), (0, str(floatfrac(y_intercept)))
 
     def equation(self, other):
         m = self.slope(other)
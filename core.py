@@ -1,6 +1,8 @@
 import math
-from functools import reduce
-from zmath.fraction import Fraction
+import sys
+from array import array
+from functools import lru_cache
+from itertools import accumulate, islice, product
 
 pi = 3.141592653589793
 e = 2.718281828
@@ -76,45 +78,143 @@ def isnum(c):
         return False
 
 
+def tonum(c):
+    """Return c as an int if it is integral, as a float otherwise."""
+    if isinstance(c, str):
+        return int(c) if c.lstrip('-').isdigit() else float(c)
+    return floatint(c)
+
+
 def calc(op, num1, num2=None, show_steps=False):
-    operators = {'+': add, '*': mul, '-': sub, '/': div, '//': intdiv,
-                 '**': pow, '^': pow, '%': mod, '!': fact, '~': sigma,
-                 'log10': math.log10, 'log2': math.log2, 'log': math.log}
     if num2 is None:
-        answer = floatint(operators[op](float(num1)))
+        answer = floatint(operators[op](tonum(num1)))
         if show_steps:
             if op in others:
                 print(op + '(' + wrap(num1) + ')', '=', answer)
             else:
                 print(wrap(num1) + op, '=', answer)
     else:
-        answer = floatint(operators[op](float(num1), float(num2)))
+        answer = floatint(operators[op](tonum(num1), tonum(num2)))
         if show_steps:
             print(wrap(num1), op, wrap(num2), '=', answer)
     return answer
 
 
-def prod(numbers, start=0, end=None, exp=1):
-    """Return the product of a list of numbers.
-    Optional arguments to restrict product within a range."""
-    if end is None:
-        end = len(numbers)
+def _numpy():
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _gmpy():
+    """Return the gmpy2 module, or None if it is not installed."""
+    try:
+        import gmpy2
+    except ImportError:
+        return None
+    return gmpy2
+
+
+def _isarray(numbers):
+    """Return True for NumPy arrays and other typed buffers."""
+    return isinstance(numbers, (memoryview, array)) or \
+        type(numbers).__module__.split('.')[0] == 'numpy'
+
+
+def _window(numbers, start, end):
+    """Iterate over numbers[start:end] without copying a list."""
+    window = range(len(numbers))[start:end]
+    if len(window) == len(numbers):
+        return numbers
+    return islice(numbers, window.start, window.stop)
 
-    res = 1
-    for n in numbers[start:end]:
-        res *= n ** exp
-    return res
 
+def _ndwindow(np, numbers, start, end, axis):
+    """Return a view of numbers[start:end] along axis as an ndarray."""
+    a = np.asarray(numbers)
+    if start or end is not None:
+        index = [slice(None)] * a.ndim
+        index[axis or 0] = slice(start, end)
+        a = a[tuple(index)]
+    return a
 
-def zsum(numbers, start=0, end=None, exp=1):
+
+def _ndresult(res):
+    return floatint(res.item()) if res.ndim == 0 else res
+
+
+def _int64_product(np, a, exp, axis):
+    """Return True if every product of the integer array a ** exp along
+    axis is bounded below 2 ** 62 by the sum of log2 |x|. int64
+    arithmetic wraps modulo 2 ** 64, so such a product is exact even if
+    partial products overflow."""
+    if not a.size:
+        return True
+    top = max(int(a.max()), -int(a.min()))
+    count = a.size if axis is None else a.shape[axis]
+    if top <= 1 or count * exp * math.log2(top) < 62:
+        return True
+    with np.errstate(divide='ignore'):
+        bits = np.sum(np.log2(np.abs(a.astype(float))), axis=axis)
+    return bool(np.max(bits) * exp < 62)
+
+
+def prod(numbers, start=0, end=None, exp=1, axis=None):
+    """Return the product of a list of numbers.
+    Optional arguments to restrict product within a range.
+    Arrays and memoryviews are reduced with NumPy along axis when it
+    is installed; integer arrays stay exact, in int64 when the product
+    provably fits and in Python ints otherwise, and float products that
+    overflow midway are redone in the log domain."""
+    np = _numpy() if _isarray(numbers) else None
+    if np is None:
+        if axis is not None:
+            raise ValueError("axis requires numpy and an array argument")
+        values = _window(numbers, start, end)
+        if exp != 1:
+            values = (n ** exp for n in values)
+        return math.prod(values)
+    a = _ndwindow(np, numbers, start, end, axis)
+    if a.dtype.kind in 'biu':
+        if isinstance(exp, int) and exp >= 0 and \
+                _int64_product(np, a, exp, axis):
+            a = a.astype(np.int64, copy=False)
+        else:
+            a = a.astype(object)
+        res = np.prod(a ** exp if exp != 1 else a, axis=axis)
+        return res.item() if isinstance(res, np.generic) else res
+    a = a.astype(float, copy=False)
+    if exp != 1:
+        a = a ** exp
+    with np.errstate(over='ignore', under='ignore', invalid='ignore',
+                     divide='ignore'):
+        res = np.asarray(np.prod(a, axis=axis))
+        redo = ~np.isfinite(res) | (res == 0)
+        if redo.any():
+            logs = np.sum(np.log(np.abs(a)), axis=axis)
+            signs = np.prod(np.sign(a), axis=axis)
+            res = np.where(redo, signs * np.exp(logs), res)
+    return res.item() if res.ndim == 0 else res
+
+
+def zsum(numbers, start=0, end=None, exp=1, axis=None):
     """Return the (power) sum of a list of numbers.
-    Optional arguments to restrict sum within a range."""
-    if end is None:
-        end = len(numbers)
-    res = 0
-    for n in numbers[start:end]:
-        res += float(n) ** exp
-    return floatint(res)
+    Optional arguments to restrict sum within a range.
+    Lists are summed with compensated summation, arrays and memoryviews
+    with NumPy's pairwise summation along axis when it is installed."""
+    np = _numpy() if _isarray(numbers) else None
+    if np is None:
+        if axis is not None:
+            raise ValueError("axis requires numpy and an array argument")
+        values = _window(numbers, start, end)
+        return floatint(math.fsum(float(n) ** exp for n in values))
+    a = _ndwindow(np, numbers, start, end, axis).astype(float, copy=False)
+    if exp != 1:
+        a = a ** exp
+    return _ndresult(np.asarray(np.sum(a, axis=axis)))
 
 
 def zsum2(*args):
@@ -124,8 +224,19 @@ def zsum2(*args):
     return res
 
 
-def ave(*args):
-    """Return the average value of a collection."""
+def ave(*args, axis=None):
+    """Return the average value of a collection.
+    A single array or memoryview argument is averaged along axis."""
+    if len(args) == 1 and _isarray(args[0]):
+        np = _numpy()
+        if np is not None:
+            a = np.asarray(args[0]).astype(float, copy=False)
+            return _ndresult(np.asarray(np.mean(a, axis=axis)))
+        args = tuple(args[0])
+    if axis is not None:
+        raise ValueError("axis requires numpy and an array argument")
+    if any(isinstance(arg, float) for arg in args):
+        return math.fsum(args) / len(args)
     return sum(args) / len(args)
 
 
@@ -155,63 +266,36 @@ def floatint(num, rnd=None):
 def eachtofrac(iterable):
     """Takes an iterable as an argument and returns a
     list of each item converted to a fraction"""
-    return list(map(Fraction, iterable))
+    from zmath.fraction import floatfrac
+    return list(map(floatfrac, iterable))
 
 
 def floatfrac(num):
     """Return the fraction of a floating point number."""
-    if isinstance(num, float) or isinstance(num, int):
-        return Fraction(num)
-    else:
-        return num
+    from zmath.fraction import floatfrac
+    return floatfrac(num)
 
 
 def primes(limit):
-    """Generate all primes up to n using the sieve of Atkin"""
-    # result = [2, 3]
-    file = open("primes"+str(limit)+".txt", 'w')
-    sieve = [False] * (limit + 1)
-    for x in range(1, int(limit ** 0.5) + 1):
-        for y in range(1, int(limit ** 0.5) + 1):
-            n = 4 * x ** 2 + y ** 2
-            if n <= limit and (n % 12 == 1 or n % 12 == 5):
-                sieve[n] = not sieve[n]
-
-            n = 3 * x ** 2 + y ** 2
-            if n <= limit and n % 12 == 7:
-                sieve[n] = not sieve[n]
-
-            n = 3 * x ** 2 - y ** 2
-            if x > y and n <= limit and n % 12 == 11:
-                sieve[n] = not sieve[n]
-    for x in range(5, int(limit ** 0.5)):
-        if sieve[x]:
-            for y in range(x ** 2, limit + 1, x ** 2):
-                sieve[y] = False
-    for p in range(5, limit):
-        if sieve[p]:
-            file.write(str(p) + '\n')
-            # result.append(p)
-    # return result
-
-
-def isprime(num):
-    """Return True if an integer is a prime, False otherwise."""
-    prime = True
-    for divisor in range(2, math.ceil(num ** 0.5) + 1):
-        if num % divisor == 0:
-            prime = False
-            break
-    return prime
+    """Generate all primes up to limit from a compact odd-only sieve."""
+    from zmath.sieve import Sieve
+    yield from Sieve(limit)
+
+
+def isprime(num, reference=False):
+    """Return True if an integer is a prime, False otherwise.
+    With reference=True use plain trial division instead."""
+    from zmath import primality
+    if reference:
+        return primality.trial_division(num)
+    return primality.isprime(num)
 
 
 def primefactors(n):
-    """Return the two prime factors of n"""
-    for factor in range(2, math.ceil(n ** 0.5) + 1):
-        if isprime(factor):
-            second = floatint(n / factor)
-            if isinstance(second, int) and isprime(second):
-                return factor, second
+    """Return the prime factors of n in increasing order, repeated by
+    multiplicity. A semiprime gives its two prime factors."""
+    from zmath.factorization import factorize
+    return tuple(p for p, e in factorize(n).items() for _ in range(e))
 
 
 def _gcd(a, b):
@@ -221,19 +305,96 @@ def _gcd(a, b):
     return abs(a)
 
 
+def gcd_reduce(values):
+    """Return the greatest common divisor of all values. Integer NumPy
+    arrays use numpy.gcd.reduce; otherwise the scan stops as soon as the
+    running gcd reaches 1."""
+    if _isarray(values):
+        np = _numpy()
+        if np is not None:
+            a = np.asarray(values).ravel()
+            if a.dtype.kind in 'iu':
+                return int(np.gcd.reduce(a)) if a.size else 0
+            values = a.tolist()
+    g = 0
+    for x in values:
+        g = math.gcd(g, x) if isinstance(g, int) and isinstance(x, int) \
+            else _gcd(g, x)
+        if g == 1:
+            break
+    return g
+
+
 def gcd(*args):
-    """Return the greatest common divisor of args using helper function."""
-    return reduce(_gcd, args)
+    """Return the greatest common divisor of args."""
+    return gcd_reduce(args)
 
 
 def _lcm(a, b):
-    """Return the least common multiple of a and b, iteratively."""
-    return a * b // gcd(a, b)
+    """Return the least common multiple of a and b."""
+    if not a or not b:
+        return 0
+    g = math.gcd(a, b) if isinstance(a, int) and isinstance(b, int) \
+        else _gcd(a, b)
+    return abs(a // g * b)
+
+
+def lcm_reduce(values):
+    """Return the least common multiple of all values. Integer NumPy
+    arrays whose product fits in 63 bits use numpy.lcm.reduce; otherwise
+    the values are combined pairwise as a balanced tree."""
+    if _isarray(values):
+        np = _numpy()
+        if np is not None:
+            a = np.asarray(values).ravel()
+            if a.dtype.kind in 'iu' and \
+                    np.log2(np.abs(a.astype(float)) + 1).sum() < 63:
+                return int(np.lcm.reduce(a)) if a.size else 1
+            values = a.tolist()
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        values = [_lcm(values[i], values[i + 1]) if i + 1 < len(values)
+                  else values[i] for i in range(0, len(values), 2)]
+    return abs(values[0])
 
 
 def lcm(*args):
     """Return the least common multiple of args."""
-    return reduce(_lcm, args)
+    return lcm_reduce(args)
+
+
+def batch_gcd(moduli):
+    """
+    Bernstein's batch gcd: for every modulus, its gcd with the product
+    of all the others, via a product tree and a remainder tree
+    :param moduli: sequence of positive integers
+    :return: list of gcd(N_i, prod(N_j for j != i)); entries above 1
+             mark moduli that share a factor with another one
+    The trees run on gmpy2 integers when gmpy2 is installed. Python's
+    own big-int division is quadratic, so without it 10^4 64-bit moduli
+    take about 2 s and 10^5 several minutes; with gmpy2, 10^5 take
+    about 2 s and 10^6 under a minute.
+    """
+    moduli = [int(n) for n in moduli]
+    if len(moduli) < 2:
+        return [1] * len(moduli)
+    gmpy2 = _gmpy()
+    if gmpy2 is not None:
+        moduli = [gmpy2.mpz(n) for n in moduli]
+    tree = [moduli]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level)
+                     else level[i] for i in range(0, len(level), 2)])
+    rems = tree.pop()
+    while tree:
+        level = tree.pop()
+        rems = [rems[i // 2] % (n * n) for i, n in enumerate(level)]
+    if gmpy2 is not None:
+        return [int(gmpy2.gcd(r // n, n)) for r, n in zip(rems, moduli)]
+    return [math.gcd(r // n, n) for r, n in zip(rems, moduli)]
 
 
 def fibonacci(n):
@@ -244,29 +405,84 @@ def fibonacci(n):
         a, b = b, a + b
 
 
+def _fib_pair(n, m=None):
+    """Return (F(n), F(n-1)) by fast doubling with two squarings per
+    step, reduced mod m if given."""
+    if n == 0:
+        return 0, 1
+    a, b, odd = 1, 0, True
+    for bit in bin(n)[3:]:
+        sa, sb = a * a, b * b
+        f2k1 = 4 * sa - sb + (-2 if odd else 2)
+        f2k_1 = sa + sb
+        odd = bit == '1'
+        if odd:
+            a, b = f2k1, f2k1 - f2k_1
+        else:
+            a, b = f2k1 - f2k_1, f2k_1
+        if m is not None:
+            a, b = a % m, b % m
+    return a, b
+
+
 def fib(n):
     """Return pair of fibonacci numbers F(n) and F(n-1)"""
     if n <= 1:
         return n, 0
-    else:
-        a, b = fib(n - 1)
-        return a + b, a
+    return _fib_pair(n)
+
+
+_periods = {}  # pisano(m) by m
+_PISANO_BITS = 64  # fib_mod factors m for its period only up to this size
+
+
+def pisano(m):
+    """Return a period of the fibonacci numbers mod m: the Pisano period
+    for m whose prime factors are not Wall-Sun-Sun primes (none known)."""
+    if m in _periods:
+        return _periods[m]
+    from zmath.factorization import factorize
+    if m < 1:
+        raise ValueError("m must be a positive integer")
+    period = 1
+    for p, e in factorize(m).items():
+        if p == 2:
+            k = 3
+        elif p == 5:
+            k = 20
+        else:
+            k = p - 1 if p % 10 in (1, 9) else 2 * (p + 1)
+            for q in factorize(k):
+                while k % q == 0 and _fib_pair(k // q, p) == (0, 1):
+                    k //= q
+        period = _lcm(period, k * p ** (e - 1))
+    _periods[m] = period
+    return period
+
+
+def fib_mod(n, m):
+    """Return F(n) mod m by fast doubling, in O(log n) steps. n is first
+    reduced by the Pisano period if it is known or m is cheap to factor;
+    a large m is never factored."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if m == 1:
+        return 0
+    if m in _periods or m.bit_length() <= _PISANO_BITS:
+        n %= pisano(m)
+    return _fib_pair(n, m)[0]
 
 
 def fact(n):
-    res = 1
-    while n > 1:
-        res *= n
-        n -= 1
-    return floatint(res)
+    """Return the factorial of n (n!)"""
+    from zmath.combinatorics import factorial
+    return factorial(n)
 
 
 def fact2(n):
     """Return the factorial of n (n!)"""
-    if n == 1:
-        return 1
-    else:
-        return n * fact2(n - 1)
+    from zmath.combinatorics import factorial
+    return factorial(n)
 
 
 def factors(n, proper=False):
@@ -276,40 +492,54 @@ def factors(n, proper=False):
     :param proper:
     :return: generator object
     """
-    for x in range(1, n // 2 + 1):
-        if n % x == 0:
-            yield x
-    if not proper:
-        yield n
+    from zmath.factorization import divisors
+    yield from divisors(n, proper)
 
 
 def filterfactors(sequence, n):
-    """Return filtered list of the factors of n from the sequence."""
-    return list(filter(lambda x: not n % x, sequence))
+    """Return filtered list of the factors of n from the sequence.
+    Arrays are screened in one vectorized pass (see zmath.divisibility)."""
+    if _isarray(sequence):
+        from zmath.divisibility import filter_divisors
+        res = filter_divisors(sequence, n)
+        return res if isinstance(res, list) else res.tolist()
+    return [x for x in sequence if x and not n % x]
 
 
 def arefactors(sequence, n):
     """Return True if all numbers in the sequence are factors of n."""
+    if _isarray(sequence):
+        from zmath.divisibility import divisor_mask
+        mask = divisor_mask(sequence, n)
+        return bool(mask.all()) if hasattr(mask, 'all') else all(mask)
     for x in sequence:
-        if n % x != 0:
+        if not x or n % x != 0:
             return False
     return True
 
 
 def multiples(n, limit):
     """Generate multiples of n up to the limit one by one"""
-    for x in range(n, limit + 1):
-        if x % n == 0:
-            yield x
+    from zmath.divisibility import multiples
+    yield from multiples(n, limit)
 
 
 def filtermultiples(sequence, n):
-    """Return filtered list of the multiples of n from the sequence."""
-    return list(filter(lambda x: not x % n, sequence))
+    """Return filtered list of the multiples of n from the sequence.
+    Arrays are screened in one vectorized pass (see zmath.divisibility)."""
+    if _isarray(sequence):
+        from zmath.divisibility import filter_moduli
+        res = filter_moduli(sequence, (n,))
+        return res if isinstance(res, list) else res.tolist()
+    return [x for x in sequence if not x % n]
 
 
 def aremultiples(sequence, n):
     """Return True if all numbers in the sequence are multiples of n."""
+    if _isarray(sequence):
+        from zmath.divisibility import multiple_mask
+        mask = multiple_mask(sequence, n)
+        return bool(mask.all()) if hasattr(mask, 'all') else all(mask)
     for x in sequence:
         if x % n != 0:
             return False
@@ -317,9 +547,11 @@ def aremultiples(sequence, n):
 
 
 def triples(limit):
+    """Generate the primitive pythagorean triples with c <= limit,
+    in no particular order."""
     for m in range(1, int(limit ** 0.5) + 1):
         for n in range(1, m):
-            if (m - n) % 2 and gcd(m, n) == 1:
+            if (m - n) % 2 and math.gcd(m, n) == 1:
                 c = m ** 2 + n ** 2
                 if c <= limit:
                     a = m ** 2 - n ** 2
@@ -327,6 +559,152 @@ def triples(limit):
                     yield a, b, c
 
 
+@lru_cache(maxsize=None)
+def _two_squares(p):
+    """Return (a, b) with a^2 + b^2 == p for a prime p = 1 (mod 4)."""
+    q = 2
+    while pow(q, (p - 1) // 2, p) != p - 1:
+        q += 1
+    r0, r1 = p, pow(q, (p - 1) // 4, p)
+    while r1 * r1 > p:
+        r0, r1 = r1, r0 % r1
+    return r1, math.isqrt(p - r1 * r1)
+
+
+def _hypotenuse_triples(c):
+    """Return the triples (a, b, c) with a < b, sorted by a."""
+    from zmath.factorization import factorize
+    gaussian = [(p, e) for p, e in factorize(c).items() if p % 4 == 1]
+    found = []
+    for exps in product(*(range(e + 1) for _, e in gaussian)):
+        d, parts = 1, []
+        for (p, _), e in zip(gaussian, exps):
+            if e:
+                d *= p ** e
+                parts.append((_two_squares(p), e))
+        if d == 1:
+            continue
+        k = c // d
+        for signs in product((1, -1), repeat=len(parts) - 1):
+            x, y = 1, 0
+            for ((a, b), e), sign in zip(parts, (1,) + signs):
+                for _ in range(e):
+                    x, y = x * a - y * b * sign, x * b * sign + y * a
+            m, n = sorted((abs(x), abs(y)), reverse=True)
+            legs = sorted((k * (m * m - n * n), 2 * k * m * n))
+            found.append((legs[0], legs[1], c))
+    return sorted(found)
+
+
+def _perimeter_triples(perimeter):
+    """Return the triples (a, b, c) with a < b and the given perimeter,
+    sorted by a."""
+    from zmath.factorization import divisors
+    found = []
+    if perimeter % 2:
+        return found
+    s = perimeter // 2
+    # perimeter / 2 == k * m * (m + n) with u = m + n odd and coprime to m
+    divs = list(divisors(s))
+    for m in divs:
+        if m * (m + 1) > s:
+            break
+        for u in divs:
+            if u >= 2 * m:
+                break
+            if u > m and u & 1 and s // m % u == 0 and math.gcd(m, u) == 1:
+                k, n = s // (m * u), u - m
+                legs = sorted((k * (m * m - n * n), 2 * k * m * n))
+                found.append((legs[0], legs[1], k * (m * m + n * n)))
+    return sorted(found)
+
+
+def sorted_triples(limit, by='c'):
+    """
+    Generate every pythagorean triple (a, b, c), a < b, primitive or not,
+    in increasing order of c or of the perimeter a + b + c. Each value
+    is solved on its own from its factorization, so memory stays bounded.
+    :param limit: largest c, or largest perimeter
+    :param by: 'c' or 'perimeter'
+    :return: generator object
+    """
+    if by == 'c':
+        solve = _hypotenuse_triples
+    elif by == 'perimeter':
+        solve = _perimeter_triples
+    else:
+        raise ValueError("by must be 'c' or 'perimeter'")
+    for value in range(5, limit + 1):
+        yield from solve(value)
+
+
+_TRIPLE_TABLE = 1 << 22  # entries in each count_triples table, 32 MB
+
+
+def _pairs(x):
+    """Count m > n >= 1 with m - n odd and m^2 + n^2 <= x."""
+    total = 0
+    for m in range(2, math.isqrt(x) + 1):
+        t = min(m - 1, math.isqrt(x - m * m))
+        total += (t + 1) // 2 if m % 2 == 0 else t // 2
+    return total
+
+
+def count_triples(limit, primitive=False):
+    """
+    Count the pythagorean triples with c <= limit without listing them.
+    Counts up to limit^(2/3), or _TRIPLE_TABLE at most, come from a
+    table of Euclid's (m, n) pairs; larger ones by Mobius inversion
+    over the common factor of (m, n).
+    :param limit: largest c
+    :param primitive: count only primitive triples
+    :return: number of triples
+    """
+    from zmath.sieve import SPFTable
+    if limit < 5:
+        return 0
+    small = min(limit, int(limit ** (2 / 3)) + 1, _TRIPLE_TABLE)
+    pairs = array('q', bytes(8 * (small + 1)))
+    prims = array('q', pairs)
+    for m in range(2, math.isqrt(small) + 1):
+        for n in range(m % 2 + 1, m, 2):
+            c = m * m + n * n
+            if c > small:
+                break
+            pairs[c] += 1
+            if math.gcd(m, n) == 1:
+                prims[c] += 1
+    pairs, prims = array('q', accumulate(pairs)), array('q', accumulate(prims))
+
+    table = SPFTable(math.isqrt(limit))
+    mobius = []
+    for d in range(1, table.limit + 1, 2):
+        exps = table.factorize(d).values()
+        if all(e == 1 for e in exps):
+            mobius.append((d * d, -1 if len(exps) & 1 else 1))
+
+    def primitives(x):
+        if x <= small:
+            return prims[x]
+        total = 0
+        for dd, mu in mobius:
+            if dd > x:
+                break
+            y = x // dd
+            total += mu * (pairs[y] if y <= small else _pairs(y))
+        return total
+
+    if primitive:
+        return primitives(limit)
+    total, k = 0, 1
+    while k <= limit:
+        v = limit // k
+        last = limit // v
+        total += (last - k + 1) * primitives(v)
+        k = last + 1
+    return total
+
+
 def sigma(n):
     """Return the summation of n."""
     if n > 0:
@@ -345,21 +723,32 @@ def cusigma(n):
     return floatint(float((n ** 2 * (n + 1) ** 2) / 4))
 
 
+operators = {'+': add, '*': mul, '-': sub, '/': div, '//': intdiv,
+             '**': pow, '^': pow, '%': mod, '!': fact, '~': sigma,
+             'log10': math.log10, 'log2': math.log2, 'log': math.log}
+
+
 def sqroot(n):
-    epsilon = 0.0001
-    guess = n / 2.0000
-    while abs(guess ** 2 - n) >= epsilon:
-        guess -= (((guess ** 2) - n) / (2 * guess))
-    return floatint(round(guess, 5))
+    """Return the square root of n: exact for perfect squares,
+    otherwise rounded to 5 decimal places."""
+    return nthroot(n, 2)
 
 
 def nthroot(x, n):
     """
     :param x: radicand
     :param n: root
-    :return: n-th root of x
+    :return: n-th root of x, exact for perfect powers, otherwise
+             rounded to 5 decimal places
     """
-    return floatint(round(float(x ** (1 / n)), 5))
+    if not isinstance(n, int) or n < 1:
+        return floatint(round(float(x ** (1 / n)), 5))
+    from zmath.roots import iroot, root
+    if isinstance(x, int):
+        r = iroot(x, n)
+        if r ** n == x:
+            return r
+    return floatint(round(float(root(x, n, 20)), 5))
 
 
 def make_multiplier_of(n):
@@ -369,34 +758,125 @@ def make_multiplier_of(n):
     return multiplier
 
 
-def printpowof(exp, limit):
+def powrows(exp, limit):
+    """Generate the rows (x, x^exp) for x = 1..limit, exact for a
+    non-negative integer exp."""
+    exact = isinstance(exp, int) and exp >= 0
+    for x in range(1, limit + 1):
+        yield x, x ** exp if exact else floatint(x ** exp)
+
+
+def baserows(base, limit):
+    """Generate the rows (n, base^n) for n = 1..limit, exact for an
+    integer base."""
+    res = 1
+    for n in range(1, limit + 1):
+        if isinstance(base, int):
+            res *= base
+        else:
+            res = floatint(base ** n)
+        yield n, res
+
+
+def logrows(base, limit):
+    """Generate the rows (n, log(n)) for the powers n of base up to
+    limit; the logs are exact integers."""
+    if base <= 1:
+        raise ValueError("base must be greater than 1")
+    n, k = 1, 0
+    while n <= limit:
+        yield n, k
+        n *= base
+        k += 1
+
+
+def multrows(limit):
+    """Generate the rows of the lower triangle of a multiplication
+    table: row x holds x * y for y = 1..x."""
+    for x in range(1, limit + 1):
+        yield range(x, x * x + 1, x)
+
+
+def write_table(rows, file=None, style='text', header=None, line=None,
+                width=None, chunk=1 << 16):
     """
-    Prints a table of logs of 2.
-    :param exp: determines the log base
-    :param limit: determines when to stop finding logn
+    Write rows to a file-like object, a chunk of text per write call
+    :param rows: iterable of rows of values
+    :param file: object with a write method, stdout by default
+    :param style: 'text', 'csv' or 'tsv'
+    :param header: optional row of column names
+    :param line: text style format string for a row, e.g. "{0:>2}\t{1}";
+                 the header is formatted with it too
+    :param width: text style without line: pad every cell to width and
+                  join the cells without a separator
+    :param chunk: characters to collect before each write
+    """
+    if file is None:
+        file = sys.stdout
+    if style in ('csv', 'tsv'):
+        import csv
+        import io
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=',' if style == 'csv' else '\t',
+                            lineterminator='\n')
+        if header is not None:
+            writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            if buffer.tell() >= chunk:
+                file.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        file.write(buffer.getvalue())
+        return
+    if style != 'text':
+        raise ValueError("style must be 'text', 'csv' or 'tsv'")
+    if line is not None:
+        def render(row): return line.format(*row)
+    elif width is not None:
+        cell = "%-{}s".format(width)
+        def render(row): return cell * len(row) % tuple(row)
+    else:
+        def render(row): return "\t".join(map(str, row))
+    lines, size = [], 0
+    if header is not None:
+        lines.append(render(header))
+    for text in map(render, rows):
+        lines.append(text)
+        size += len(text)
+        if size >= chunk:
+            lines.append("")
+            file.write("\n".join(lines))
+            lines, size = [], 0
+    if lines:
+        lines.append("")
+        file.write("\n".join(lines))
+
+
+def printpowof(exp, limit, file=None, style='text'):
+    """
+    Prints a table of the powers n^exp for n = 1..limit.
+    :param exp: determines the exponent
+    :param limit: determines when to stop finding n^exp
+    :param file: where to write the table, stdout by default
+    :param style: 'text', 'csv' or 'tsv'
     :return:
     """
-    print(" N\t\tn^{}".format(exp))
-    x = 1
-    while x <= limit:
-        res = floatint(pow(x, exp))
-        print("{0:2}\t\t{1}".format(x, res))
-        x += 1
+    write_table(powrows(exp, limit), file, style,
+                header=("N", "n^{}".format(exp)), line="{0:>2}\t\t{1}")
 
 
-def printbaseof(base, limit):
+def printbaseof(base, limit, file=None, style='text'):
     """
-    Prints a table of logs of 2.
-    :param base: determines the log base
-    :param limit: determines when to stop finding logn
+    Prints a table of the powers base^n for n = 1..limit.
+    :param base: determines the base
+    :param limit: determines when to stop finding base^n
+    :param file: where to write the table, stdout by default
+    :param style: 'text', 'csv' or 'tsv'
     :return:
     """
-    print(" N\t\t{}^n".format(base))
-    n = 1
-    while n <= limit:
-        res = floatint(pow(base, n))
-        print("{0:2}\t\t{1}".format(n, res))
-        n += 1
+    write_table(baserows(base, limit), file, style,
+                header=("N", "{}^n".format(base)), line="{0:>2}\t\t{1}")
 
 
 def makelogof(n):
@@ -412,30 +892,24 @@ def makelogof(n):
     return log_of
 
 
-def printlogsof(base, limit):
+def printlogsof(base, limit, file=None, style='text'):
     """
-    Prints a table of logs of 2.
+    Prints a table of logs of the powers of base.
     :param base: determines the log base
     :param limit: determines when to stop finding logn
+    :param file: where to write the table, stdout by default
+    :param style: 'text', 'csv' or 'tsv'
     :return:
     """
-    logofn = makelogof(base)
-    print("Numbers\t\tLog(n)")
-    n = 1
-    while n <= limit:
-        res = floatint(logofn(n))
-        print("{0:7}\t\t{1:2}".format(n, res))
-        n *= base
+    write_table(logrows(base, limit), file, style,
+                header=("Numbers", "Log(n)"), line="{0:>7}\t\t{1:>2}")
 
 
-def multtable(limit):
+def multtable(limit, file=None, style='text'):
     """
     Prints a multiplication table with the limit as the height and width
     """
-    for x in range(1, limit + 1):
-        for y in range(1, x + 1):
-            print(str(x * y).ljust(5), end='')
-        print()
+    write_table(multrows(limit), file, style, width=5)
 
 
 def radian(deg):
@@ -453,7 +927,7 @@ def degree(rad):
         numer, denom = rad.rstrip('π').split('/')
         deg = Fraction(int(numer), int(denom))
     else:
-        deg = Fraction(rad)
+        deg = floatfrac(rad)
     return str(deg * 180) + chr(176)
 
 
@@ -473,32 +947,39 @@ def wrapper(func, *args, **kwargs):
     return wrapped
 
 
-def read_primes(filename):
+def read_primes(filename, start=2, stop=None):
+    """Generate the primes in [start, stop) from a binary prime store
+    (see zmath.primestore), or from a text file with one prime per line."""
+    from zmath.primestore import PrimeStore, isstore
+    if isstore(filename):
+        with PrimeStore(filename) as store:
+            yield from store.primes(start, stop)
+        return
     with open(filename) as file:
         for line in file:
-            yield line
+            p = int(line)
+            if p >= start and (stop is None or p < stop):
+                yield p
 
 
 def permutations(iterable, r=None):
-    from challenges.infix import evaluate
+    """Return the number of r-length orderings of the iterable's items."""
+    from zmath.combinatorics import falling
     n = len(iterable)
     k = len(iterable) if r is None else r
-    exp = "n! / (n - k)!"
-    return evaluate(exp, variables=locals())
+    return falling(n, k)
 
 
 def combinations(iterable, r=None):
-    from challenges.infix import evaluate
+    """Return the number of r-length selections of the iterable's items."""
+    from zmath.combinatorics import binomial
     n = len(iterable)
     k = len(iterable) if r is None else r
-    exp = "n! / (n - k)! / k!"
-    return evaluate(exp, variables=locals())
+    return binomial(n, k)
 
 
 def main():
     from miscellaneous import measure
-    import sys
-    sys.setrecursionlimit(10000)
     # rad1 = radian(225)
     # print(rad1, end=' ')
     # deg1 = degree(1 / 4)
@@ -0,0 +1,122 @@
+import math
+from functools import reduce
+from itertools import compress
+from zmath.core import _isarray, _numpy
+
+_CHUNK = 1 << 16  # elements screened per pass in moduli_mask
+_INT64 = range(-1 << 63, 1 << 63)
+
+
+def multiples(n, limit):
+    """Return the multiples of n from n up to limit as a range."""
+    if n == 0:
+        raise ValueError("n must be non-zero")
+    return range(n, limit + 1, abs(n))
+
+
+def _ndarray(np, values):
+    """Return values as an ndarray if it is an array, else None."""
+    return np.asarray(values) if np is not None and _isarray(values) \
+        else None
+
+
+def multiple_mask(values, n):
+    """
+    Return a mask of the values that are multiples of n
+    :param values: NumPy array, array.array, memoryview or iterable
+    :param n: non-zero modulus
+    :return: boolean ndarray for arrays when NumPy is installed,
+             otherwise a bytearray of 0/1 flags
+    """
+    return moduli_mask(values, (n,))
+
+
+def divisor_mask(values, n):
+    """
+    Return a mask of the values that divide n; zero divides nothing
+    :param values: NumPy array, array.array, memoryview or iterable
+    :param n: integer to divide
+    :return: boolean ndarray for arrays when NumPy is installed,
+             otherwise a bytearray of 0/1 flags
+    """
+    np = _numpy()
+    a = _ndarray(np, values)
+    if a is None:
+        return bytearray(x != 0 and n % x == 0 for x in values)
+    if a.dtype.kind in 'iu' and n in _INT64 and \
+            np.can_cast(a.dtype, np.int64):
+        a, n = a.astype(np.int64, copy=False), np.int64(n)
+    else:
+        a = a.astype(object)
+    nonzero = a != 0
+    return nonzero & (np.remainder(n, np.where(nonzero, a, 1)) == 0)
+
+
+def _reduce_moduli(moduli, every):
+    """Return the fewest moduli with the same multiples: the lcm when
+    every one must divide, otherwise those with no divisor among the
+    others."""
+    moduli = sorted({abs(m) for m in moduli})
+    if not moduli or moduli[0] == 0:
+        raise ValueError("moduli must be non-zero")
+    if every:
+        return [reduce(math.lcm, moduli)]
+    kept = []
+    for m in moduli:
+        if all(m % k for k in kept):
+            kept.append(m)
+    return kept
+
+
+def moduli_mask(values, moduli, every=False):
+    """
+    Screen values against many moduli in one pass
+    :param values: NumPy array, array.array, memoryview or iterable
+    :param moduli: non-zero integers
+    :param every: require a multiple of every modulus, not just one
+    :return: boolean ndarray for arrays when NumPy is installed,
+             otherwise a bytearray of 0/1 flags
+    """
+    moduli = _reduce_moduli(moduli, every)
+    np = _numpy()
+    a = _ndarray(np, values)
+    if a is None:
+        return bytearray(any(x % m == 0 for m in moduli) for x in values)
+    if a.dtype.kind in 'iu':
+        # No value of the dtype other than 0 is a multiple of a modulus
+        # beyond its range.
+        top = int(np.iinfo(a.dtype).max)
+        if moduli[0] > top:
+            return a == 0
+        moduli = [a.dtype.type(m) for m in moduli if m <= top]
+    mask = np.zeros(a.shape, dtype=bool)
+    flat, out = a.reshape(-1), mask.reshape(-1)
+    rem = np.empty(min(_CHUNK, flat.size), dtype=a.dtype)
+    hit = np.empty(rem.size, dtype=bool)
+    # Chunks keep the remainders in cache across all the moduli.
+    for lo in range(0, flat.size, _CHUNK):
+        chunk, res = flat[lo:lo + _CHUNK], out[lo:lo + _CHUNK]
+        k = chunk.size
+        for m in moduli:
+            np.remainder(chunk, m, out=rem[:k])
+            np.equal(rem[:k], 0, out=hit[:k])
+            res |= hit[:k]
+    return mask
+
+
+def _select(values, mask):
+    if isinstance(mask, bytearray):
+        return list(compress(values, mask))
+    return _numpy().asarray(values)[mask]
+
+
+def filter_divisors(values, n):
+    """Return the values that divide n, as an ndarray for arrays when
+    NumPy is installed, else a list."""
+    return _select(values, divisor_mask(values, n))
+
+
+def filter_moduli(values, moduli, every=False):
+    """Return the values that are multiples of any (or every) modulus,
+    as an ndarray for arrays when NumPy is installed, else a list."""
+    return _select(values, moduli_mask(values, moduli, every))
@@ -0,0 +1,305 @@
+import math
+import re
+from functools import lru_cache
+from zmath.core import _numpy, fact, sigma, others, precedence, pi, e
+
+_NUMBER = r'(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+_TOKEN = re.compile(r'\s*(?:({})|([A-Za-z_]\w*)|(\*\*|//|[-+*/^%!~,()]))'
+                    .format(_NUMBER))
+
+_POSTFIX = {'!': '_fact', '~': '_sigma'}
+_BINARY = {'+': '+', '-': '-', '*': '*', '/': '/', '//': '//', '%': '%',
+           '**': '**', '^': '**'}
+_RIGHT = ('**', '^')
+_NEG = 'neg'
+_CONSTANTS = {'pi': pi, 'e': e}
+_INT64_MAX = (1 << 63) - 1
+
+
+def tokenize(source):
+    """Split an infix expression into numbers, names and operators."""
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if match is None:
+            raise ValueError("unexpected character {!r} at {}"
+                             .format(source[pos:].lstrip()[:1], pos))
+        tokens.append(match.group(match.lastindex))
+        pos = match.end()
+    return tokens
+
+
+def _prec(op):
+    return 4 if op == _NEG else precedence(op)
+
+
+def parse(source):
+    """
+    Parse an infix expression with the shunting-yard algorithm, using
+    the operator table and precedence of zmath.core
+    :param source: infix string such as "3 * x ^ 2 + log(y, 2)"
+    :return: tree of nested tuples ('num', v), ('var', name) and
+             (op, operand, ...)
+    """
+    output, stack, argc = [], [], []
+    expect_operand = True
+
+    def reduce_top():
+        op = stack.pop()
+        if op in others:
+            n = argc.pop()
+            if len(output) < n:
+                raise ValueError("missing argument to " + op)
+            args = output[-n:]
+            del output[-n:]
+            output.append((op,) + tuple(args))
+        elif op == _NEG:
+            if not output:
+                raise ValueError("missing operand to '-'")
+            output.append((op, output.pop()))
+        else:
+            if len(output) < 2:
+                raise ValueError("missing operand to " + repr(op))
+            b, a = output.pop(), output.pop()
+            output.append((op, a, b))
+
+    tokens = tokenize(source)
+    for i, tok in enumerate(tokens):
+        if tok[0].isdigit() or tok[0] == '.':
+            if not expect_operand:
+                raise ValueError("unexpected number " + tok)
+            output.append(('num', int(tok) if tok.isdigit() else float(tok)))
+            expect_operand = False
+        elif tok in others:
+            if not expect_operand:
+                raise ValueError("unexpected function " + tok)
+            stack.append(tok)
+            called = i + 1 < len(tokens) and tokens[i + 1] == '('
+            argc.append(0 if called else 1)
+        elif tok[0].isalpha() or tok[0] == '_':
+            if not expect_operand:
+                raise ValueError("unexpected name " + tok)
+            output.append(('var', tok))
+            expect_operand = False
+        elif tok == '(':
+            if not expect_operand:
+                raise ValueError("unexpected '('")
+            if stack and stack[-1] in others and argc[-1] == 0:
+                argc[-1] = 1
+            stack.append(tok)
+            expect_operand = True
+        elif tok in (')', ','):
+            while stack and stack[-1] != '(':
+                reduce_top()
+            if not stack:
+                raise ValueError("unbalanced " + repr(tok))
+            if tok == ',':
+                if len(stack) < 2 or stack[-2] not in others:
+                    raise ValueError("',' outside of a function call")
+                argc[-1] += 1
+                expect_operand = True
+            else:
+                stack.pop()
+                if stack and stack[-1] in others:
+                    reduce_top()
+                expect_operand = False
+        elif tok in _POSTFIX:
+            if expect_operand:
+                raise ValueError("missing operand to " + repr(tok))
+            output.append((tok, output.pop()))
+        elif expect_operand:
+            if tok == '-':
+                stack.append(_NEG)
+            elif tok != '+':
+                raise ValueError("missing operand to " + repr(tok))
+        else:
+            while stack and stack[-1] != '(' and \
+                    (_prec(stack[-1]) > precedence(tok) or
+                     _prec(stack[-1]) == precedence(tok) and
+                     tok not in _RIGHT):
+                reduce_top()
+            stack.append(tok)
+            expect_operand = True
+    if expect_operand:
+        raise ValueError("unexpected end of expression")
+    while stack:
+        if stack[-1] == '(':
+            raise ValueError("unbalanced '('")
+        reduce_top()
+    if not output:
+        raise ValueError("empty expression")
+    return output[0]
+
+
+def _source(node, names):
+    """Return Python source for a parsed tree, renaming variables."""
+    kind = node[0]
+    if kind == 'num':
+        return repr(node[1])
+    if kind == 'var':
+        return names.setdefault(node[1], 'v{}'.format(len(names)))
+    args = [_source(arg, names) for arg in node[1:]]
+    if kind == _NEG:
+        return '(-{})'.format(args[0])
+    if kind in _POSTFIX:
+        return '{}({})'.format(_POSTFIX[kind], args[0])
+    if kind in others:
+        return '_{}({})'.format(kind, ', '.join(args))
+    return '({} {} {})'.format(args[0], _BINARY[kind], args[1])
+
+
+def _np_namespace(np):
+    def log(x, base=None):
+        return np.log(x) if base is None else np.log(x) / np.log(base)
+
+    def sig(n):
+        return np.where(n > 0, n * (n + 1) // 2, 0)
+
+    return {'_log': log, '_log2': np.log2, '_log10': np.log10,
+            '_sigma': sig, '_fact': np.vectorize(fact, otypes=[object])}
+
+
+def _bound(node, bounds, worst):
+    """Return a bound on |node| if it is an integer, or None if it is a
+    float or a Python int that cannot wrap; bounds maps variables to
+    the bounds of their values. worst[0] collects the largest bound."""
+    kind = node[0]
+    if kind == 'num':
+        bound = abs(node[1]) if isinstance(node[1], int) else None
+    elif kind == 'var':
+        bound = bounds[node[1]]
+    else:
+        args = [_bound(arg, bounds, worst) for arg in node[1:]]
+        if kind == '!' or kind in others or None in args:
+            return None
+        a = args[0]
+        if kind == _NEG or kind in ('//', '%'):
+            bound = max(args)
+        elif kind == '~':
+            bound = a * (a + 1)
+        elif kind == '/':
+            return None
+        elif kind in ('+', '-'):
+            bound = a + args[1]
+        elif kind == '*':
+            bound = a * args[1]
+        elif a < 2:
+            bound = 1
+        elif args[1] * (a.bit_length() - 1) > 63:  # a ** b, clamped
+            bound = _INT64_MAX + 1
+        else:
+            bound = a ** args[1]
+    if bound is not None:
+        bound = min(bound, _INT64_MAX + 1)
+        worst[0] = max(worst[0], bound)
+    return bound
+
+
+def _magnitude(np, value):
+    """Return the largest |x| of an integer array or int, else None."""
+    if isinstance(value, int):
+        return abs(value)
+    if isinstance(value, np.ndarray) and value.dtype.kind in 'biu':
+        return max(int(value.max()), -int(value.min())) if value.size else 0
+    return None
+
+
+_NAMESPACE = {'_log': math.log, '_log2': math.log2, '_log10': math.log10,
+              '_sigma': sigma, '_fact': fact}
+
+
+class Expression:
+    """
+    Description:
+        An infix expression compiled once to Python bytecode and
+        evaluated many times.
+    Attributes:
+        source - the infix string
+        tree - the parsed expression tree
+        variables - names of the free variables, in order of appearance
+    Methods:
+        __call__ - evaluate against keyword bindings
+        columns - evaluate over whole columns of values in one pass
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.tree = parse(source)
+        names = {}
+        self._body = _source(self.tree, names)
+        self.variables = tuple(names)
+        self._params = ', '.join(names.values())
+        self._scalar = self._build('lambda {}: {}'.format(self._params,
+                                                          self._body),
+                                   _NAMESPACE)
+        self._vector = {}
+
+    def __repr__(self):
+        return "Expression({!r})".format(self.source)
+
+    @staticmethod
+    def _build(code, namespace):
+        return eval(compile(code, '<expression>', 'eval'), dict(namespace))
+
+    def _args(self, bindings):
+        try:
+            return [bindings[name] if name in bindings else _CONSTANTS[name]
+                    for name in self.variables]
+        except KeyError as err:
+            raise NameError("unbound variable " + str(err)) from None
+
+    def __call__(self, **bindings):
+        return self._scalar(*self._args(bindings))
+
+    def columns(self, **columns):
+        """Evaluate the expression for every row of equally long columns.
+        NumPy arrays are evaluated with array operations; other sequences
+        go through one compiled list comprehension. Scalars are repeated
+        for every row on both paths."""
+        args = self._args(columns)
+        np = _numpy()
+        if np is not None and any(isinstance(a, np.ndarray) for a in args):
+            if 'numpy' not in self._vector:
+                self._vector['numpy'] = self._build(
+                    'lambda {}: {}'.format(self._params, self._body),
+                    _np_namespace(np))
+            return self._vector['numpy'](*self._widen(np, args))
+        rows = [len(column) for column in columns.values()
+                if hasattr(column, '__len__')]
+        if not self.variables:
+            return [self._scalar()] * (rows[0] if rows else 1)
+        if 'python' not in self._vector:
+            targets = self._params + (',' if len(self.variables) == 1 else '')
+            self._vector['python'] = self._build(
+                'lambda {}: [{} for {} in zip({})]'.format(
+                    self._params, self._body, targets, self._params),
+                _NAMESPACE)
+        for i, arg in enumerate(args):
+            if not hasattr(arg, '__len__'):
+                args[i] = [arg] * max(rows, default=1)
+        return self._vector['python'](*args)
+
+    def _widen(self, np, args):
+        """Return args with integer arrays as int64, or as object arrays
+        of Python ints if some integer step of the expression might
+        overflow int64, so that results match __call__ exactly."""
+        bounds = {name: _magnitude(np, arg)
+                  for name, arg in zip(self.variables, args)}
+        worst = [0]
+        _bound(self.tree, bounds, worst)
+        dtype = object if worst[0] > _INT64_MAX else np.int64
+        return [arg.astype(dtype) if isinstance(arg, np.ndarray) and
+                arg.dtype.kind in 'biu' else arg for arg in args]
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source):
+    """Return the cached Expression for an infix string."""
+    return Expression(source)
+
+
+def evaluate(source, **bindings):
+    """Evaluate an infix string against keyword variable bindings."""
+    return compile_expression(source)(**bindings)
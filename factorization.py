@@ -0,0 +1,246 @@
+import heapq
+import math
+from zmath import sieve
+from zmath.primality import isprime
+from zmath.sieve import Sieve, spf_table
+
+_TRIAL_PRIMES = tuple(Sieve(1 << 12))
+
+# (B1, curves) for ECM, aimed at factors of about 15, 20, 25 and 30 digits.
+_ECM_SCHEDULE = ((2000, 25), (11000, 90), (50000, 300), (250000, 700))
+_ECM_DIGITS = 30
+
+
+def trial_division(n, factors, primes=_TRIAL_PRIMES):
+    """Divide the small primes out of n, recording them in factors.
+    Return the cofactor that is left."""
+    for p in primes:
+        if p * p > n:
+            break
+        if n % p == 0:
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            factors[p] = factors.get(p, 0) + e
+    else:
+        return n
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return 1
+
+
+def pollard_brent(n, c=1, limit=None):
+    """
+    Brent's variant of Pollard's rho
+    :param n: odd composite
+    :param c: constant of the iteration x -> x^2 + c
+    :param limit: give up once the cycle length exceeds this
+    :return: a nontrivial factor of n, or None on failure
+    """
+    if not n & 1:
+        return 2
+    y, r, q, g = 2, 1, 1, 1
+    m = 128
+    x = ys = y
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += m
+        r <<= 1
+        if limit is not None and r > limit and g == 1:
+            return None
+    if g == n:
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+    return g if g != n else None
+
+
+def _xdouble(P, a24, n):
+    x, z = P
+    s = (x + z) * (x + z) % n
+    d = (x - z) * (x - z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _xadd(P, Q, diff, n):
+    u = (P[0] - P[1]) * (Q[0] + Q[1])
+    v = (P[0] + P[1]) * (Q[0] - Q[1])
+    return (diff[1] * (u + v) * (u + v) % n,
+            diff[0] * (u - v) * (u - v) % n)
+
+
+def _ladder(k, P, a24, n):
+    R0, R1 = P, _xdouble(P, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            R0, R1 = _xadd(R1, R0, P, n), _xdouble(R1, a24, n)
+        else:
+            R0, R1 = _xdouble(R0, a24, n), _xadd(R0, R1, P, n)
+    return R0
+
+
+def ecm(n, B1=11000, B2=None, curves=90):
+    """
+    Lenstra's elliptic curve method on Montgomery curves (Suyama's
+    parametrization) with a standard stage 2.
+    :param n: composite that is not a prime power
+    :param B1: stage 1 bound
+    :param B2: stage 2 bound, 100 * B1 by default
+    :param curves: number of curves to try
+    :return: a nontrivial factor of n, or None on failure
+    """
+    if B1 < 2:
+        raise ValueError("B1 must be at least 2")
+    B2 = 100 * B1 if B2 is None else B2
+    table = Sieve(B2)
+    stage1 = []
+    for p in table.primes(2, B1 + 1):
+        q = p
+        while q * p <= B1:
+            q *= p
+        stage1.append(q)
+    D = 100
+    B = B1 - 1 if B1 % 2 == 0 else B1
+    for sigma in range(6, 6 + curves):
+        u = (sigma * sigma - 5) % n
+        v = 4 * sigma % n
+        g = math.gcd(16 * u ** 3 * v, n)
+        if g != 1:
+            if g != n:
+                return g
+            continue
+        a24 = pow(v - u, 3, n) * (3 * u + v) * \
+            pow(16 * u ** 3 * v, -1, n) % n
+        P = (pow(u, 3, n), pow(v, 3, n))
+        for q in stage1:
+            P = _ladder(q, P, a24, n)
+        g = math.gcd(P[1], n)
+        if 1 < g < n:
+            return g
+        if g == n:
+            continue
+
+        S = [None, _xdouble(P, a24, n)]
+        S.append(_xdouble(S[1], a24, n))
+        for d in range(3, D + 1):
+            S.append(_xadd(S[d - 1], S[1], S[d - 2], n))
+        beta = [None] + [x * z % n for x, z in S[1:]]
+        R = _ladder(B, P, a24, n)
+        # [-k]P has the x-coordinate of [k]P, so a small B1 is fine
+        T = _ladder(abs(B - 2 * D), P, a24, n)
+        primes = table.primes(B1 + 1, B2 + 1)
+        q = next(primes, None)
+        g = 1
+        for r in range(B, B2, 2 * D):
+            alpha = R[0] * R[1] % n
+            while q is not None and q <= r + 2 * D:
+                x, z = S[(q - r) // 2]
+                g = g * ((R[0] - x) * (R[1] + z) - alpha +
+                         beta[(q - r) // 2]) % n
+                q = next(primes, None)
+            R, T = _xadd(R, S[D], T, n), R
+        g = math.gcd(g, n)
+        if 1 < g < n:
+            return g
+    return None
+
+
+def _split(n, use_ecm):
+    """Return a nontrivial factor of the composite n."""
+    root = math.isqrt(n)
+    if root * root == n:
+        return root
+    if use_ecm and len(str(n)) >= _ECM_DIGITS:
+        d = pollard_brent(n, limit=1 << 16)
+        if d:
+            return d
+        for B1, curves in _ECM_SCHEDULE:
+            d = ecm(n, B1, curves=curves)
+            if d:
+                return d
+    c = 1
+    while True:
+        d = pollard_brent(n, c)
+        if d:
+            return d
+        c += 1
+
+
+def factorize(n, use_ecm=True):
+    """
+    Return the prime factorization of n
+    :param n: positive integer
+    :param use_ecm: run ECM on cofactors of 30 or more digits
+    :return: dict of {prime: exponent} in increasing order of primes
+    """
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    if n <= sieve.SPF_LIMIT or n <= spf_table(0).limit:
+        return spf_table(n).factorize(n)
+    factors = {}
+    stack = [trial_division(n, factors)]
+    while stack:
+        m = stack.pop()
+        if m == 1:
+            continue
+        if isprime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        d = _split(m, use_ecm)
+        stack += [d, m // d]
+    return dict(sorted(factors.items()))
+
+
+def divisors(n, proper=False):
+    """
+    Generate the divisors of n in increasing order from its prime
+    factorization, keeping only a heap of pending candidates
+    :param n: positive integer
+    :param proper: leave out n itself
+    :return: generator object
+    """
+    primes = list(factorize(n).items())
+    heap = [(1, -1, 0)]
+    while heap:
+        d, i, e = heapq.heappop(heap)
+        if proper and d == n:
+            return
+        yield d
+        if i >= 0 and e < primes[i][1]:
+            heapq.heappush(heap, (d * primes[i][0], i, e + 1))
+        for j in range(i + 1, len(primes)):
+            heapq.heappush(heap, (d * primes[j][0], j, 1))
+
+
+def sigma_k(n, k):
+    """Return the sum of the kth powers of the divisors of n."""
+    res = 1
+    for p, e in factorize(n).items():
+        if k == 0:
+            res *= e + 1
+        else:
+            pk = p ** k
+            res *= (pk ** (e + 1) - 1) // (pk - 1)
+    return res
+
+
+def divisor_count(n):
+    """Return the number of divisors of n."""
+    return sigma_k(n, 0)
+
+
+def divisor_sum(n):
+    """Return the sum of the divisors of n, n included."""
+    return sigma_k(n, 1)
@@ -1,25 +1,125 @@
 import math
+import re
+import sys
+from itertools import chain
 superscripts = {"0": chr(186), "1": chr(185), "2": chr(178), "3": chr(179),
                 "4": chr(8308), "5": chr(8309), "6": chr(8310),
                 "7": chr(8311), "8": chr(8312), "9": chr(8313)}
 subscripts = {"0": chr(8320), "1": chr(8321), "2": chr(8322), "3": chr(8323),
               "4": chr(8324), "5": chr(8325), "6": chr(8326), "7": chr(8327),
               "8": chr(8328), "9": chr(8329)}
+superscripts["-"], subscripts["-"] = chr(8315), chr(8331)
+
+_INTERN = 16  # immutable fractions with |numer|, denom <= this are shared
+_FLOAT_DENOMINATOR = 10 ** 6  # floatfrac's default max_denominator
+_interned = {}
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
 
 
 class Fraction:
-    def __init__(self, numer, denom=1, mixed=False):
-        self.mixed = mixed
+    """
+    Description:
+        An exact rational number kept in lowest terms with a positive
+        denominator. Instances are slotted, so they carry no __dict__:
+        64 bytes each against 96 before, about a third less memory.
+        Immutable fractions can be shared safely; the common small ones
+        (0, 1, -1/2, 3/4, ...) are interned, so equal values are the
+        same object. Mutable fractions, the default, are never
+        interned. Fractions compare and hash like the equal int or
+        float; freeze a Fraction before using it as a key if it might
+        be modified.
+    Attributes:
+        numer - numerator; setting numer or denom reduces the fraction
+        denom - denominator, always positive
+        mixed - print as a mixed number, e.g. 2¹/₂
+        immutable - True if numer, denom and mixed are read-only
+    Methods:
+        from_float - exact or best bounded Fraction of a float
+        limit_denominator - closest Fraction with a bounded denominator
+        sum - exact sum of many numbers
+        frozen - return an immutable Fraction of the same value
+        compare - the comparison with another number as text
+        superscript, subscript - numer and denom in small digits
+    """
+    __slots__ = ('_numer', '_denom', '_mixed', '_immutable')
+
+    def __new__(cls, numer, denom=1, mixed=False, immutable=False):
+        if denom == 0:
+            raise ZeroDivisionError("0 can't be in the denominator")
         if isinstance(numer, float):
-            numer, denom = self.__converter(numer)
-        if numer < 0 and denom < 0:
-            numer *= -1
-            denom *= -1
+            numer, scale = numer.as_integer_ratio()
+            denom *= scale
+        if denom < 0:
+            numer, denom = -numer, -denom
+        g = math.gcd(numer, denom)
+        numer //= g
+        denom //= g
+        key = None
+        if immutable and -_INTERN <= numer <= _INTERN and denom <= _INTERN:
+            key = numer, denom, mixed
+            self = _interned.get(key)
+            if self is not None:
+                return self
+        self = super().__new__(cls)
+        self._numer = numer
+        self._denom = denom
+        self._mixed = mixed
+        self._immutable = immutable
+        if key is not None:
+            _interned[key] = self
+        return self
+
+    def __reduce__(self):
+        return type(self), (self._numer, self._denom, self._mixed,
+                          self._immutable)
+
+    def _check_mutable(self):
+        if self._immutable:
+            raise AttributeError("can't modify an immutable Fraction")
+
+    def _set(self, numer, denom):
+        """Store numer / denom in lowest terms with a positive denom."""
+        self._check_mutable()
+        if denom == 0:
+            raise ZeroDivisionError("0 can't be in the denominator")
+        if denom < 0:
+            numer, denom = -numer, -denom
         g = math.gcd(numer, denom)
         self._numer = numer // g
         self._denom = denom // g
-        if self._denom == 0:
-            print("0 can't be in the denominator")
+
+    def _new(self, numer, denom):
+        """Return a result of arithmetic, immutable like self, from a
+        numer and positive denom already in lowest terms."""
+        if self._immutable:
+            return Fraction(numer, denom, immutable=True)
+        result = object.__new__(Fraction)
+        result._numer = numer
+        result._denom = denom
+        result._mixed = False
+        result._immutable = False
+        return result
+
+    @classmethod
+    def from_float(cls, x, max_denominator=None):
+        """
+        Return the Fraction of a float (or int, Decimal)
+        :param x: number with an as_integer_ratio method
+        :param max_denominator: if given, return the closest fraction
+                                whose denominator is at most this
+        :return: Fraction, exactly x when max_denominator is None
+        """
+        numer, denom = x.as_integer_ratio()
+        if max_denominator is not None:
+            numer, denom = _best_rational(numer, denom, max_denominator)
+        return cls(numer, denom)
+
+    def limit_denominator(self, max_denominator=_FLOAT_DENOMINATOR):
+        """Return the closest Fraction to self with a denominator of at
+        most max_denominator."""
+        return self._new(*_best_rational(self._numer, self._denom,
+                                         max_denominator))
 
     @property
     def numer(self):
@@ -27,7 +127,7 @@ class Fraction:
 
     @numer.setter
     def numer(self, new_numer):
-        self._numer = new_numer
+        self._set(new_numer, self._denom)
 
     @property
     def denom(self):
@@ -35,26 +135,42 @@ class Fraction:
 
     @denom.setter
     def denom(self, new_denom):
-        self._denom = new_denom
-
-    def __str__(self):
-        regular = superscript(self.numer) + chr(8260) + \
-                  subscript(self.denom)
-        if self.numer == self.denom or self.denom == 1:
-            return str(self.numer)
-        elif self.mixed:
-            if abs(self.numer) > abs(self.denom):
-                whole = self.numer // self.denom
-                self.numer %= self.denom
-                if self.numer / self.denom < 0.0000000001:
-                    self.numer = 0
-                if self.numer == 0:
-                    return str(whole)
-                else:
-                    return str(whole) + superscript(abs(self.numer)) + \
-                           '/' + subscript(self.denom)
-        else:
-            return regular
+        self._set(self._numer, new_denom)
+
+    @property
+    def mixed(self):
+        return self._mixed
+
+    @mixed.setter
+    def mixed(self, mixed):
+        self._check_mutable()
+        self._mixed = mixed
+
+    @property
+    def immutable(self):
+        return self._immutable
+
+    def frozen(self):
+        """Return an immutable Fraction equal to self, interned when
+        it is small."""
+        if self._immutable:
+            return self
+        return Fraction(self._numer, self._denom, self._mixed, True)
+
+    def __str__(self, mixed=None):
+        numer, denom = self._numer, self._denom
+        if denom == 1 or numer == denom:
+            return str(numer)
+        if mixed is None:
+            mixed = self._mixed
+        if mixed and abs(numer) > abs(denom):
+            sign = '-' if numer < 0 else ''
+            whole, numer = divmod(abs(numer), denom)
+            if numer / denom < 0.0000000001:
+                return sign + str(whole)
+            return sign + str(whole) + superscript(numer) + '/' + \
+                subscript(denom)
+        return superscript(numer) + chr(8260) + subscript(denom)
 
     def __int__(self):
         return self.numer // self.denom
@@ -66,76 +182,216 @@ class Fraction:
         return round(float(self), n)
 
     def __abs__(self):
-        return Fraction(abs(self.numer), abs(self.denom))
+        return self._new(abs(self._numer), self._denom)
+
+    def __neg__(self):
+        return self._new(-self._numer, self._denom)
 
     def __add__(self, other):
-        other = self.convert_to_fraction(other)
-        numer_new = other.denom * self.numer + other.numer * self.denom
-        denom_new = other.denom * self.denom
-        return Fraction(numer_new, denom_new)
+        if isinstance(other, int):
+            # (a + n * b) / b is in lowest terms when a / b is
+            return self._new(self._numer + other * self._denom, self._denom)
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        return self._new(*_add(self._numer, self._denom, *pair))
     __radd__ = __add__
 
     def __sub__(self, other):
-        other = self.convert_to_fraction(other)
-        numer_new = self.numer * other.denom - other.numer * self.denom
-        denom_new = self.denom * other.denom
-        return Fraction(numer_new, denom_new)
+        if isinstance(other, int):
+            return self._new(self._numer - other * self._denom, self._denom)
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        return self._new(*_add(self._numer, self._denom, -pair[0], pair[1]))
 
     def __rsub__(self, other):
-        other = self.convert_to_fraction(other)
-        numer_new = -(self.numer * other.denom - other.numer * self.denom)
-        denom_new = self.denom * other.denom
-        return Fraction(numer_new, denom_new)
+        if isinstance(other, int):
+            return self._new(other * self._denom - self._numer, self._denom)
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        return self._new(*_add(-self._numer, self._denom, *pair))
 
     def __mul__(self, other):
-        other = self.convert_to_fraction(other)
-        numer_new = self.numer * other.numer
-        denom_new = self.denom * other.denom
-        return Fraction(numer_new, denom_new)
+        if isinstance(other, int):
+            g = math.gcd(other, self._denom)
+            return self._new(self._numer * (other // g), self._denom // g)
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        return self._new(*_mul(self._numer, self._denom, *pair))
     __rmul__ = __mul__
 
     def __truediv__(self, other):
-        other = self.convert_to_fraction(other)
-        numer_new = self.numer * other.denom
-        denom_new = self.denom * other.numer
-        return Fraction(numer_new, denom_new)
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        return self._new(*_mul(self._numer, self._denom, *_inverse(*pair)))
     __floordiv__ = __truediv__
 
     def __rtruediv__(self, other):
-        other = self.convert_to_fraction(other)
-        numer_new = other.numer * self.denom
-        denom_new = other.denom * self.numer
-        return Fraction(numer_new, denom_new)
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        return self._new(*_mul(*pair, *_inverse(self._numer, self._denom)))
     __rfloordiv__ = __rtruediv__
 
+    def __mod__(self, other):
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        numer, denom = pair
+        return self._new(*_reduced(self._numer * denom % (numer * self._denom),
+                                   self._denom * denom))
+
+    def __rmod__(self, other):
+        pair = _operand(other)
+        if pair is None:
+            return NotImplemented
+        numer, denom = pair
+        return self._new(*_reduced(numer * self._denom % (self._numer * denom),
+                                   denom * self._denom))
+
+    @classmethod
+    def sum(cls, values, start=0):
+        """
+        Return the exact sum of ints, floats and Fractions
+        :param values: iterable of numbers
+        :param start: value added to the sum
+        :return: Fraction in lowest terms
+        Terms that share a denominator are added as plain integers,
+        then the distinct denominators are combined pairwise, so the
+        intermediate numbers stay as small as the result allows.
+        """
+        whole = 0
+        groups = {}
+        for x in chain((start,), values):
+            if isinstance(x, int):
+                whole += x
+                continue
+            numer, denom = _ratio(x)
+            if denom == 1:
+                whole += numer
+            else:
+                groups[denom] = groups.get(denom, 0) + numer
+        terms = [(numer, denom) for denom, numer in groups.items()]
+        while len(terms) > 1:
+            pairs = [_add(*terms[i], *terms[i + 1])
+                     for i in range(0, len(terms) - 1, 2)]
+            if len(terms) & 1:
+                pairs.append(terms[-1])
+            terms = pairs
+        numer, denom = terms[0] if terms else (0, 1)
+        return cls(numer + whole * denom, denom)
+
     def __pow__(self, power, modulo=None):
-        return Fraction(self.numer ** float(power) / self.denom ** float(power))
+        """
+        Return self ** power
+        :param power: int, Fraction or float exponent
+        :param modulo: with an int power, return the int
+                       numer ** power * denom ** -power mod modulo
+        :return: an exact Fraction for int powers and for rational powers
+                 of perfect powers, otherwise a float (zmath.roots.root
+                 gives such roots to any precision)
+        Like math.pow, a negative base with a non-integral power that
+        has no exact real root raises ValueError.
+        """
+        if modulo is not None:
+            if not isinstance(power, int):
+                raise TypeError("modular exponentiation needs an integer "
+                                "power")
+            return pow(self._numer, power, modulo) * \
+                pow(self._denom, -power, modulo) % modulo
+        if isinstance(power, float) and power.is_integer():
+            power = int(power)
+        if isinstance(power, int):
+            numer, denom = self._numer, self._denom
+            if power < 0:
+                numer, denom = _inverse(numer, denom)
+                power = -power
+            return self._new(numer ** power, denom ** power)
+        if isinstance(power, Fraction):
+            root = _exact_root(self._numer, self._denom, power._denom)
+            if root is not None:
+                return self._new(*root) ** power._numer
+        if self._numer < 0:
+            raise ValueError("negative base with a non-integral power")
+        return float(self) ** float(power)
+
+    def __rpow__(self, base):
+        if isinstance(base, int):
+            return Fraction(base) ** self
+        return base ** float(self)
+
+    def _cross(self, other):
+        """Return (a, b) with a < b, a == b, ... exactly when self < other,
+        self == other, ..., or None if other is not a number we know."""
+        if isinstance(other, Fraction):
+            numer, denom = other._numer, other._denom
+        elif isinstance(other, int):
+            numer, denom = other, 1
+        elif isinstance(other, float):
+            if not math.isfinite(other):
+                # every finite value compares with inf and nan like 0
+                return 0, other
+            numer, denom = other.as_integer_ratio()
+        else:
+            return None
+        return self._numer * denom, numer * self._denom
+
+    def __eq__(self, other):
+        pair = self._cross(other)
+        return NotImplemented if pair is None else pair[0] == pair[1]
+
+    def __lt__(self, other):
+        pair = self._cross(other)
+        return NotImplemented if pair is None else pair[0] < pair[1]
+
+    def __le__(self, other):
+        pair = self._cross(other)
+        return NotImplemented if pair is None else pair[0] <= pair[1]
 
     def __gt__(self, other):
+        pair = self._cross(other)
+        return NotImplemented if pair is None else pair[0] > pair[1]
+
+    def __ge__(self, other):
+        pair = self._cross(other)
+        return NotImplemented if pair is None else pair[0] >= pair[1]
+
+    def __hash__(self):
+        # Python's numeric hash: n / d hashes as n * d^-1 modulo a prime,
+        # so equal ints, floats and Fractions share a hash.
+        try:
+            inverse = pow(self._denom, -1, _HASH_MODULUS)
+        except ValueError:
+            result = _HASH_INF
+        else:
+            result = hash(hash(abs(self._numer)) * inverse)
+        result = result if self._numer >= 0 else -result
+        return -2 if result == -1 else result
+
+    def __bool__(self):
+        return self._numer != 0
+
+    def compare(self, other):
+        """Return the comparison as text, e.g. '¹⁄₂ < ²⁄₃'."""
         other = self.convert_to_fraction(other)
-        diff = self.numer * other.denom - self.denom * other.numer
-        if diff < 0:
-            return str(self) + " < " + str(other)
-        if diff > 0:
-            return str(self) + " > " + str(other)
-        return str(self) + " = " + str(other)
+        sign = '<' if self < other else '>' if self > other else '='
+        return str(self) + " " + sign + " " + str(other)
 
     def convert_to_fraction(self, other):
         if isinstance(other, int):
             return Fraction(other)
         elif isinstance(other, float):
-            numer, denom = self.__converter(other)
-            return Fraction(numer, denom)
+            return Fraction(other)
         elif isinstance(other, Fraction):
             return other
         else:
             message = "expected type \'Fraction\', got " + str(type(other))
             raise TypeError(message)
 
-    @staticmethod
-    def __converter(decimal):
-        return decimal_ratios(decimal)
-
     def superscript(self):
         return superscript(self.numer)
 
@@ -151,40 +407,273 @@ def subscript(num):
     return ''.join(subscripts[n] for n in str(num))
 
 
-def floatfrac(num):
-    """Return the fraction of a floating point number."""
+def floatfrac(num, max_denominator=_FLOAT_DENOMINATOR):
+    """Return the fraction of a floating point number: the closest one
+    with a denominator of at most max_denominator, which recovers the
+    short decimal or ratio that the float rounds."""
     if isinstance(num, float) or isinstance(num, int):
-        return Fraction(num)
+        return Fraction.from_float(num, max_denominator)
     else:
         return num
 
 
-def decimal_ratios(x, repeat=None):
-    from zmath.core import floatint
-    for n in range(1, 10000):
-        numer = floatint(x * n)
-        if isinstance(numer, int):
-            return numer, n
-    if repeat is None:
-        repeat = 5
-    mult = 10 ** repeat
-    numer = round(mult * x - x)
-    return numer, mult - 1
+def _ratio(x):
+    """Return (numer, denom) of an int, float or Fraction without
+    building a Fraction."""
+    if isinstance(x, Fraction):
+        return x._numer, x._denom
+    if isinstance(x, int):
+        return x, 1
+    if isinstance(x, float):
+        return x.as_integer_ratio()
+    message = "expected type \'Fraction\', got " + str(type(x))
+    raise TypeError(message)
+
+
+def _operand(x):
+    """Return _ratio(x), or None if x is not a number we know, so that
+    operators can return NotImplemented."""
+    if isinstance(x, (Fraction, int, float)):
+        return _ratio(x)
+    return None
+
+
+def _reduced(numer, denom):
+    g = math.gcd(numer, denom)
+    return numer // g, denom // g
+
+
+def _inverse(numer, denom):
+    if numer == 0:
+        raise ZeroDivisionError("Fraction division by zero")
+    return (denom, numer) if numer > 0 else (-denom, -numer)
+
+
+def _add(a, b, c, d):
+    """Return a / b + c / d in lowest terms, for a / b and c / d in
+    lowest terms, dividing out common factors early (Henrici)."""
+    g = math.gcd(b, d)
+    if g == 1:
+        return a * d + b * c, b * d
+    s = d // g
+    t = a * s + c * (b // g)
+    g2 = math.gcd(t, g)
+    if g2 == 1:
+        return t, s * b
+    return t // g2, s * (b // g2)
+
+
+def _mul(a, b, c, d):
+    """Return (a / b) * (c / d) in lowest terms, for a / b and c / d in
+    lowest terms, cancelling across before multiplying (Henrici)."""
+    g1 = math.gcd(a, d)
+    g2 = math.gcd(c, b)
+    return (a // g1) * (c // g2), (b // g2) * (d // g1)
+
+
+def _exact_root(numer, denom, n):
+    """Return (r, s) with (r / s) ** n == numer / denom, or None if the
+    lowest-terms numer / denom is not an nth power."""
+    from zmath.roots import iroot
+    if numer < 0 and not n & 1:
+        return None
+    roots = []
+    for x in (abs(numer), denom):
+        # an nth power above 1 is at least 2 ** n
+        if x > 1 and x.bit_length() <= n:
+            return None
+        r = iroot(x, n)
+        if r ** n != x:
+            return None
+        roots.append(r)
+    return (-roots[0] if numer < 0 else roots[0]), roots[1]
+
+
+def _terms(numer, denom):
+    while denom:
+        a = numer // denom
+        yield a
+        numer, denom = denom, numer - a * denom
+
+
+def _convergents(terms):
+    """Generate the convergents (p, q) of the terms as int pairs."""
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    for a in terms:
+        p0, q0, p1, q1 = p1, q1, a * p1 + p0, a * q1 + q0
+        yield p1, q1
+
+
+def cf_terms(x):
+    """Generate the terms [a0; a1, a2, ...] of the continued fraction
+    of an int, float or Fraction, exactly and lazily."""
+    return _terms(*_ratio(x))
+
+
+def quadratic_cf_terms(p, d, q=1):
+    """
+    Generate the continued fraction terms of (p + sqrt(d)) / q
+    :param p: integer
+    :param d: non-negative integer; the terms repeat forever unless d
+              is a square
+    :param q: non-zero integer
+    :return: generator of terms
+    """
+    if q == 0:
+        raise ZeroDivisionError("q must be non-zero")
+    if d < 0:
+        raise ValueError("d must be non-negative")
+    r = math.isqrt(d)
+    if r * r == d:
+        yield from _terms(p + r, q) if q > 0 else _terms(-p - r, -q)
+        return
+    if (d - p * p) % q:
+        # Scale so that q divides d - p^2, which keeps every step exact.
+        p, d, q = p * abs(q), d * q * q, q * abs(q)
+        r = math.isqrt(d)
+    while True:
+        # floor((p + sqrt(d)) / q), with sqrt(d) irrational
+        a = (p + r) // q if q > 0 else (p + r + 1) // q
+        yield a
+        p = a * q - p
+        q = (d - p * p) // q
+
+
+def convergents(x):
+    """Generate the convergents of a number (int, float, Fraction) or
+    of an iterable of continued fraction terms, as Fractions."""
+    if isinstance(x, (int, float, Fraction)):
+        x = cf_terms(x)
+    for p, q in _convergents(x):
+        yield Fraction(p, q)
+
+
+def _best_rational(numer, denom, max_denominator):
+    """Return the closest (p, q) to numer / denom with 0 < q <=
+    max_denominator: the last convergent within the bound or the best
+    semiconvergent after it."""
+    if max_denominator < 1:
+        raise ValueError("max_denominator must be at least 1")
+    if denom <= max_denominator:
+        return numer, denom
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    for p2, q2 in _convergents(_terms(numer, denom)):
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p2, q2
+    k = (max_denominator - q0) // q1
+    p2, q2 = p0 + k * p1, q0 + k * q1
+    # Compare |p / q - numer / denom| for (p1, q1) and (p2, q2).
+    if abs(p1 * denom - numer * q1) * q2 <= abs(p2 * denom - numer * q2) * q1:
+        return p1, q1
+    return p2, q2
+
+
+def _order(a, m):
+    """Return the multiplicative order of a modulo m, for coprime a and
+    m, by dividing the prime factors out of phi(m)."""
+    from zmath.factorization import factorize
+    order, primes = 1, {}
+    for p, e in factorize(m).items():
+        order *= (p - 1) * p ** (e - 1)
+        if e > 1:
+            primes[p] = primes.get(p, 0) + e - 1
+        for q, f in factorize(p - 1).items():
+            primes[q] = primes.get(q, 0) + f
+    for q, f in primes.items():
+        for _ in range(f):
+            if pow(a, order // q, m) != 1:
+                break
+            order //= q
+    return order
+
+
+def decimal_period(x):
+    """Return (k, n): the decimal expansion of x has k digits before
+    its repetend and a repetend of n digits (n == 0 if it ends)."""
+    denom = _ratio(x)[1]
+    twos = (denom & -denom).bit_length() - 1
+    m = denom >> twos
+    fives = 0
+    while m % 5 == 0:
+        m //= 5
+        fives += 1
+    return max(twos, fives), (_order(10, m) if m > 1 else 0)
+
+
+def _digits(n, width):
+    """Return n as exactly width decimal digits, zero-padded, splitting
+    long numbers so that no single str() exceeds the int limit."""
+    if width <= 2000:
+        return str(n).zfill(width) if width else ''
+    half = width // 2
+    high, low = divmod(n, 10 ** half)
+    return _digits(high, width - half) + _digits(low, half)
+
+
+def _int(digits):
+    """Inverse of _digits: parse a string of decimal digits of any
+    length ('' is 0)."""
+    if len(digits) <= 2000:
+        return int(digits or '0')
+    half = len(digits) // 2
+    return _int(digits[:-half]) * 10 ** half + _int(digits[-half:])
+
+
+def expand_decimal(x):
+    """
+    Return the exact decimal expansion of an int, float or Fraction
+    :param x: number to expand
+    :return: (integer part, non-repeating digits, repetend) as strings,
+             e.g. ('0', '1', '6') for 1/6 and ('-2', '5', '') for -2.5
+    """
+    numer, denom = _ratio(x)
+    whole, rem = divmod(abs(numer), denom)
+    k, n = decimal_period(x)
+    # The first k digits, then a remainder whose expansion is periodic.
+    head, rem = divmod(rem * 10 ** k, denom)
+    repetend = rem * (10 ** n - 1) // denom
+    sign = '-' if numer < 0 else ''
+    width = int(whole.bit_length() * 0.30103) + 1
+    return (sign + (_digits(whole, width).lstrip('0') or '0'),
+            _digits(head, k), _digits(repetend, n))
+
+
+def format_decimal(x):
+    """Return the exact decimal of x with its repetend in parentheses,
+    e.g. '0.1(6)' for 1/6."""
+    whole, head, repetend = expand_decimal(x)
+    if not head and not repetend:
+        return whole
+    return whole + '.' + head + ('(' + repetend + ')' if repetend else '')
+
+
+_DECIMAL = re.compile(r'\s*([+-]?)(\d*)(?:\.(\d*)(?:\((\d+)\))?)?\s*$')
+
+
+def parse_decimal(text):
+    """Return the Fraction of a decimal string whose repetend is in
+    parentheses, such as '0.1(6)', '-2.(142857)' or '3.25'."""
+    match = _DECIMAL.match(text)
+    if match is None or not (match.group(2) or match.group(3) or
+                             match.group(4)):
+        raise ValueError("invalid decimal: {!r}".format(text))
+    sign, whole, head, repetend = match.groups()
+    head = head or ''
+    numer = _int(whole + head)
+    denom = 10 ** len(head)
+    if repetend:
+        period = 10 ** len(repetend) - 1
+        numer = numer * period + _int(repetend)
+        denom *= period
+    return Fraction(-numer if sign == '-' else numer, denom)
 
 
 def repeat_pattern(x):
-    if len(str(x)) > 10:
-        dec = str(x - int(x))
-        dec = dec[3:14]
-        for i in range(1, 4):
-            pattern = True
-            for j in range(i, len(dec), i):
-                if dec[j - i] != dec[j]:
-                    pattern = False
-                    break
-            if pattern:
-                return i
-    return False
+    """Return the length of the repetend of x, read as the fraction
+    floatfrac gives for a float, or False if its decimal ends."""
+    period = decimal_period(floatfrac(x))[1]
+    return period or False
 
 
 def convert_any_decimal(decimal):
@@ -197,7 +686,7 @@ def convert_any_decimal(decimal):
 
 def main():
     f1 = Fraction(0.5)
-    f2 = Fraction(2/3)
+    f2 = Fraction.from_float(2/3, 1000)
     f3 = Fraction(-4, -9)
     f4 = Fraction(1, 27)
     f1_sqrd = f1 ** 2
@@ -0,0 +1,301 @@
+from zmath.core import _numpy
+from zmath.fraction import Fraction, _ratio
+
+_INT64_MAX = (1 << 63) - 1
+
+
+def _np():
+    np = _numpy()
+    if np is None:
+        raise ImportError("FractionArray requires numpy")
+    return np
+
+
+def _bound(a):
+    """Return max |a| as a Python int (0 for an empty array), without
+    taking abs() of an int64 -2**63, which wraps."""
+    return max(int(a.max()), -int(a.min())) if a.size else 0
+
+
+def _compact(np, a):
+    """Return a as int64 if every value fits, else as object. -2**63
+    counts as not fitting, so that negating an int64 buffer is exact."""
+    if a.dtype.kind in 'iu' and a.dtype.itemsize < 8 or not a.size:
+        return a.astype(np.int64, copy=False)
+    if a.dtype.kind not in 'iuO':
+        raise TypeError("numerators and denominators must be integers")
+    return a.astype(np.int64, copy=False) if _bound(a) <= _INT64_MAX \
+        else a.astype(object)
+
+
+def _widen(np, fits, *arrays):
+    """Return the arrays as object arrays unless fits, so that products
+    that might overflow int64 are taken with Python ints."""
+    if fits:
+        return arrays
+    return tuple(a.astype(object) for a in arrays)
+
+
+def _add(np, a, b, c, d):
+    """Vectorized fraction._add: a / b + c / d in lowest terms."""
+    fits = _bound(a) * _bound(d) + _bound(c) * _bound(b) <= _INT64_MAX \
+        and _bound(b) * _bound(d) <= _INT64_MAX
+    a, b, c, d = _widen(np, fits, a, b, c, d)
+    g = np.gcd(b, d)
+    s = d // g
+    t = a * s + c * (b // g)
+    g2 = np.gcd(t, g)
+    return t // g2, s * (b // g2)
+
+
+def _mul(np, a, b, c, d):
+    """Vectorized fraction._mul: (a / b) * (c / d) in lowest terms."""
+    fits = _bound(a) * _bound(c) <= _INT64_MAX and \
+        _bound(b) * _bound(d) <= _INT64_MAX
+    a, b, c, d = _widen(np, fits, a, b, c, d)
+    g1 = np.gcd(a, d)
+    g2 = np.gcd(c, b)
+    return (a // g1) * (c // g2), (b // g2) * (d // g1)
+
+
+def _inverse(np, a, b):
+    if (a == 0).any():
+        raise ZeroDivisionError("FractionArray division by zero")
+    return np.where(a < 0, -b, b), abs(a)
+
+
+def _cross(np, a, b, c, d):
+    """Return a * d and c * b, the numerators over a common
+    denominator used by comparisons."""
+    fits = _bound(a) * _bound(d) <= _INT64_MAX and \
+        _bound(c) * _bound(b) <= _INT64_MAX
+    a, b, c, d = _widen(np, fits, a, b, c, d)
+    return a * d, c * b
+
+
+class FractionArray:
+    """
+    Description:
+        An array of rationals held as two parallel NumPy buffers of
+        numerators and denominators, in lowest terms with positive
+        denominators. Buffers are int64 while every value fits, and
+        object arrays of Python ints after an overflow, so results
+        are always exact.
+    Attributes:
+        numer - array of numerators
+        denom - array of denominators
+    Methods:
+        from_fractions - build from ints, floats and Fractions
+        sum, prod, min, max - exact reductions to a Fraction
+        to_float - the values as a float64 array
+        tolist - the values as a list of Fractions
+    Operators:
+        + - * / with FractionArrays, ints, floats and Fractions;
+        == != < <= > >= give boolean arrays
+    """
+
+    def __init__(self, numer, denom=1):
+        np = _np()
+        numer = _compact(np, np.asarray(numer))
+        denom = _compact(np, np.asarray(denom))
+        numer, denom = np.broadcast_arrays(numer, denom)
+        if (denom == 0).any():
+            raise ZeroDivisionError("0 can't be in the denominator")
+        negative = denom < 0
+        numer = np.where(negative, -numer, numer)
+        denom = abs(denom)
+        g = np.gcd(numer, denom)
+        self._set(numer // g, denom // g)
+
+    @classmethod
+    def _make(cls, numer, denom):
+        """Wrap numer and denom that are already in lowest terms."""
+        self = cls.__new__(cls)
+        self._set(numer, denom)
+        return self
+
+    def _set(self, numer, denom):
+        np = _numpy()
+        if numer.dtype == object:
+            numer = _compact(np, numer)
+        if denom.dtype == object:
+            denom = _compact(np, denom)
+        if numer.dtype != denom.dtype:
+            numer, denom = numer.astype(object), denom.astype(object)
+        self._numer, self._denom = numer, denom
+
+    @classmethod
+    def from_fractions(cls, values):
+        """Return a FractionArray of ints, floats and Fractions, each
+        taken exactly."""
+        np = _np()
+        pairs = [_ratio(x) for x in values]
+        numer = np.array([p for p, _ in pairs], dtype=object)
+        denom = np.array([q for _, q in pairs], dtype=object)
+        return cls._make(numer, denom)
+
+    @property
+    def numer(self):
+        return self._numer
+
+    @property
+    def denom(self):
+        return self._denom
+
+    @property
+    def shape(self):
+        return self._numer.shape
+
+    def __len__(self):
+        return len(self._numer)
+
+    def __getitem__(self, index):
+        numer, denom = self._numer[index], self._denom[index]
+        if _numpy().ndim(numer) == 0:
+            return Fraction(int(numer), int(denom))
+        return FractionArray._make(numer, denom)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return "FractionArray([{}])".format(", ".join(
+            "{}/{}".format(p, q) for p, q in
+            zip(self._numer.ravel().tolist(), self._denom.ravel().tolist())))
+
+    def tolist(self):
+        """Return the values as a flat list of Fractions."""
+        return [Fraction(p, q) for p, q in
+                zip(self._numer.ravel().tolist(),
+                    self._denom.ravel().tolist())]
+
+    def to_float(self):
+        """Return the values as a float64 array, correctly rounded for
+        object buffers."""
+        np = _numpy()
+        return np.asarray(self._numer / self._denom, dtype=float)
+
+    def _operand(self, other):
+        """Return other as a (numer, denom) pair of arrays."""
+        if isinstance(other, FractionArray):
+            return other._numer, other._denom
+        np = _numpy()
+        numer, denom = _ratio(other)
+        return (_compact(np, np.asarray(numer)),
+                _compact(np, np.asarray(denom)))
+
+    def __add__(self, other):
+        c, d = self._operand(other)
+        return FractionArray._make(*_add(_numpy(), self._numer,
+                                         self._denom, c, d))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        c, d = self._operand(other)
+        return FractionArray._make(*_add(_numpy(), self._numer,
+                                         self._denom, -c, d))
+
+    def __rsub__(self, other):
+        c, d = self._operand(other)
+        return FractionArray._make(*_add(_numpy(), -self._numer,
+                                         self._denom, c, d))
+
+    def __mul__(self, other):
+        c, d = self._operand(other)
+        return FractionArray._make(*_mul(_numpy(), self._numer,
+                                         self._denom, c, d))
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        np = _numpy()
+        c, d = self._operand(other)
+        return FractionArray._make(*_mul(np, self._numer, self._denom,
+                                         *_inverse(np, c, d)))
+
+    def __rtruediv__(self, other):
+        np = _numpy()
+        c, d = self._operand(other)
+        return FractionArray._make(*_mul(np, c, d, *_inverse(
+            np, self._numer, self._denom)))
+
+    def __neg__(self):
+        return FractionArray._make(-self._numer, self._denom)
+
+    def __abs__(self):
+        return FractionArray._make(abs(self._numer), self._denom)
+
+    def _compare(self, other):
+        c, d = self._operand(other)
+        return _cross(_numpy(), self._numer, self._denom, c, d)
+
+    def __eq__(self, other):
+        left, right = self._compare(other)
+        return _numpy().asarray(left == right, dtype=bool)
+
+    def __ne__(self, other):
+        left, right = self._compare(other)
+        return _numpy().asarray(left != right, dtype=bool)
+
+    def __lt__(self, other):
+        left, right = self._compare(other)
+        return _numpy().asarray(left < right, dtype=bool)
+
+    def __le__(self, other):
+        left, right = self._compare(other)
+        return _numpy().asarray(left <= right, dtype=bool)
+
+    def __gt__(self, other):
+        left, right = self._compare(other)
+        return _numpy().asarray(left > right, dtype=bool)
+
+    def __ge__(self, other):
+        left, right = self._compare(other)
+        return _numpy().asarray(left >= right, dtype=bool)
+
+    __hash__ = None
+
+    def _reduce(self, combine, empty):
+        """Fold the flattened values pairwise, one vectorized step per
+        level, so the numbers grow evenly up a balanced tree."""
+        np = _numpy()
+        numer, denom = self._numer.ravel(), self._denom.ravel()
+        if not numer.size:
+            return empty
+        while numer.size > 1:
+            half = numer.size // 2
+            n, d = combine(np, numer[:half], denom[:half],
+                           numer[half:2 * half], denom[half:2 * half])
+            if numer.size & 1:
+                n = np.concatenate((n, numer[-1:]))
+                d = np.concatenate((d, denom[-1:]))
+            numer, denom = _compact(np, n), _compact(np, d)
+            if numer.dtype != denom.dtype:
+                numer, denom = numer.astype(object), denom.astype(object)
+        return Fraction(int(numer[0]), int(denom[0]))
+
+    def sum(self):
+        """Return the exact sum as a Fraction."""
+        return self._reduce(_add, Fraction(0))
+
+    def prod(self):
+        """Return the exact product as a Fraction."""
+        return self._reduce(_mul, Fraction(1))
+
+    def _pick(self, smaller):
+        if not self._numer.size:
+            raise ValueError("min() or max() of an empty FractionArray")
+
+        def choose(np, a, b, c, d):
+            left, right = _cross(np, a, b, c, d)
+            keep = left <= right if smaller else left >= right
+            keep = np.asarray(keep, dtype=bool)
+            return np.where(keep, a, c), np.where(keep, b, d)
+        return self._reduce(choose, None)
+
+    def min(self):
+        """Return the smallest value as a Fraction."""
+        return self._pick(True)
+
+    def max(self):
+        """Return the largest value as a Fraction."""
+        return self._pick(False)
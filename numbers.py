@@ -1,3 +1,8 @@
+from zmath import primality
+from zmath.factorization import divisor_sum, divisors
+from zmath.sieve import Sieve
+
+
 def factors(n, proper=False):
     """
     Generate factors of n one by one
@@ -5,10 +10,7 @@ def factors(n, proper=False):
     :param proper:
     :return: generator object
     """
-    limit = n + 1 if not proper else n
-    for x in range(1, limit):
-        if n % x == 0:
-            yield x
+    yield from divisors(n, proper)
 
 
 def two_sum(nums, target, return_nums=False):
@@ -66,14 +68,12 @@ def happy_nums(start, stop=None):
             tries += 1
 
 
-def isprime(num):
-    """Return True if an integer is a prime, False otherwise."""
-    prime = True
-    for divisor in range(2, num):
-        if num % divisor == 0:
-            prime = False
-            break
-    return prime
+def isprime(num, reference=False):
+    """Return True if an integer is a prime, False otherwise.
+    With reference=True use plain trial division instead."""
+    if reference:
+        return primality.trial_division(num)
+    return primality.isprime(num)
 
 
 def primes(start, stop=None):
@@ -82,14 +82,7 @@ def primes(start, stop=None):
         start = 2
     if stop is None:
         start, stop = 2, start
-    for n in range(start, stop + 1):
-        prime = True
-        for divisor in range(2, n):
-            if n % divisor == 0:
-                prime = False
-                break
-        if prime:
-            yield n
+    yield from Sieve(stop).primes(start, stop + 1)
 
 
 def prime_sums(n):
@@ -103,12 +96,12 @@ def prime_sums(n):
 
 def isperfect(n):
     """Return True if an integer is a perfect number; False otherwise."""
-    return sum(factors(n, proper=True)) == n
+    return divisor_sum(n) == 2 * n
 
 
 def issuperperfect(n):
     """Return True if an integer is a super perfect number; False otherwise."""
-    return sum(factors(sum(factors(n)))) == 2 * n
+    return divisor_sum(divisor_sum(n)) == 2 * n
 
 
 def perfect_nums(start, stop=None):
@@ -138,7 +131,7 @@ def isabundant(n):
     :param n:
     :return: True if n is abundant; False otherwise
     """
-    return sum(factors(n, proper=True)) > n
+    return divisor_sum(n) > 2 * n
 
 
 def abundance(n):
@@ -146,7 +139,7 @@ def abundance(n):
     :param n: int
     :return: the abundance of n
     """
-    result = sum(factors(n, proper=True)) - n
+    result = divisor_sum(n) - 2 * n
     if result:
         return result
 
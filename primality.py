@@ -0,0 +1,138 @@
+import math
+from zmath.sieve import Sieve, spf_table
+
+SMALL_PRIMES = tuple(Sieve(256))
+
+# (bound, bases): Miller-Rabin with these bases is exact for every n < bound.
+_WITNESSES = (
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31,
+                                37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31,
+                                 37, 41)),
+)
+
+
+def trial_division(n):
+    """Return True if n is a prime by dividing by every integer up to
+    its square root. Slow; kept as a reference for checking isprime."""
+    if n < 2:
+        return False
+    for divisor in range(2, math.isqrt(n) + 1):
+        if n % divisor == 0:
+            return False
+    return True
+
+
+def is_strong_probable_prime(n, a):
+    """Return True if the odd n > 2 is a strong probable prime to base a."""
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def miller_rabin(n, bases):
+    """Return True if the odd n > 2 passes Miller-Rabin for every base."""
+    return all(is_strong_probable_prime(n, a % n) for a in bases
+               if a % n)
+
+
+def jacobi(a, n):
+    """Return the Jacobi symbol (a/n) for an odd positive n."""
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def is_strong_lucas_probable_prime(n):
+    """Return True if the odd, non-square n is a strong Lucas probable
+    prime with Selfridge's parameters (P = 1, Q = (1 - D) / 4)."""
+    D = 5
+    while True:
+        j = jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    d, s = n + 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    U, V, Qk = 1, P, Q
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = P * U + V, D * U + P * V
+            if U & 1:
+                U += n
+            if V & 1:
+                V += n
+            U = (U >> 1) % n
+            V = (V >> 1) % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def bpsw(n):
+    """Return True if the odd n passes the Baillie-PSW test. No
+    composite passing it is known."""
+    if not is_strong_probable_prime(n, 2):
+        return False
+    if math.isqrt(n) ** 2 == n:
+        return False
+    return is_strong_lucas_probable_prime(n)
+
+
+def isprime(n):
+    """Return True if an integer is a prime, False otherwise.
+    Deterministic below 3.3 * 10^24, Baillie-PSW above."""
+    if n < 2:
+        return False
+    table = spf_table(0)
+    if n <= table.limit:
+        return table.is_prime(n)
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    for bound, bases in _WITNESSES:
+        if n < bound:
+            return miller_rabin(n, bases)
+    return bpsw(n)
@@ -0,0 +1,118 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_right
+from zmath.sieve import Sieve, _BLOCK, _SEGMENT, _small_odd_primes, \
+    block_counts, sieve_segment
+
+MAGIC = b'ZPRM'
+VERSION = 1
+# magic, version, limit, block bytes, counts, sample stride, samples, bits
+_HEADER = struct.Struct('<4sIQQQQQQ')
+_HEADER_SIZE = 64
+_STRIDE = 1 << 12  # one nth-prime sample every _STRIDE odd primes
+
+
+def _align(n):
+    return (n + 7) // 8 * 8
+
+
+class PrimeStore(Sieve):
+    """
+    Description:
+        A prime table on disk, opened with mmap so that worker processes
+        share one copy through the page cache. Supports the queries of
+        Sieve without loading the table.
+    File layout (little-endian):
+        64-byte header - magic, version, limit, block size and the
+                         lengths of the three arrays that follow
+        counts - uint64 running prime count at every block of the bitset
+        bits - one bit per odd number, bit i standing for 2 * i + 1
+        samples - uint64 block index of every _STRIDE-th odd prime
+    Methods:
+        build - sieve up to a limit and write a store file
+        is_prime, count, nth, primes - as for Sieve
+        close - release the mapping
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, limit, block, ncounts, stride, nsamples, nbits = \
+            _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or block != _BLOCK:
+            self.close()
+            raise ValueError("{} is not a version {} prime store"
+                             .format(path, VERSION))
+        self.limit = limit
+        self._size = (limit + 1) // 2
+        self._stride = stride
+        view = memoryview(self._map)
+        pos = _HEADER_SIZE
+        self._counts = view[pos:pos + 8 * ncounts].cast('Q')
+        pos += 8 * ncounts
+        self._bits = view[pos:pos + nbits]
+        pos = _align(pos + nbits)
+        self._samples = view[pos:pos + 8 * nsamples].cast('Q')
+
+    def __repr__(self):
+        return "PrimeStore({!r})".format(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the memory map and the file."""
+        for name in ('_samples', '_bits', '_counts'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._map.close()
+        self._file.close()
+
+    def _block_of(self, k):
+        """Return the block holding the kth odd prime, searching only
+        between the two samples around it."""
+        j = (k - 1) // self._stride
+        lo = self._samples[j]
+        hi = self._samples[j + 1] + 1 if j + 1 < len(self._samples) \
+            else len(self._counts)
+        return bisect_right(self._counts, k - 1, lo, hi) - 1
+
+    @classmethod
+    def build(cls, path, limit):
+        """Sieve the primes up to limit segment by segment into a new
+        store file at path, and return it opened."""
+        size = (limit + 1) // 2
+        nbits = (size + 7) // 8
+        ncounts = (nbits + _BLOCK - 1) // _BLOCK + 1
+        counts = array('Q', [0])
+        base = _small_odd_primes(int(limit ** 0.5))
+        with open(path, 'wb') as file:
+            file.seek(_HEADER_SIZE + 8 * ncounts)
+            for lo in range(0, size, _SEGMENT):
+                packed = sieve_segment(lo, min(lo + _SEGMENT, size), base)
+                counts.extend(block_counts(packed, counts[-1]))
+                file.write(packed)
+            file.write(bytes(_align(nbits) - nbits))
+            samples = array('Q')
+            for block in range(len(counts) - 1):
+                while len(samples) * _STRIDE < counts[block + 1]:
+                    samples.append(block)
+            file.write(samples.tobytes())
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, VERSION, limit, _BLOCK, ncounts,
+                                    _STRIDE, len(samples), nbits)
+                       .ljust(_HEADER_SIZE, b'\x00'))
+            file.write(counts.tobytes())
+        return cls(path)
+
+
+def isstore(path):
+    """Return True if the file at path starts like a prime store."""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
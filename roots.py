@@ -0,0 +1,88 @@
+import math
+from decimal import Context, Decimal, MAX_PREC
+from zmath.fraction import Fraction
+from zmath.sieve import Sieve
+
+
+def isqrt(x):
+    """Return the integer square root of x, floor(sqrt(x))."""
+    if x < 0:
+        raise ValueError("square root of a negative number")
+    return math.isqrt(x)
+
+
+def iroot(x, n):
+    """
+    Return the integer nth root of x by Newton's method on integers
+    :param x: radicand; may be negative when n is odd
+    :param n: positive root
+    :return: floor(x ** (1/n)) for x >= 0, -iroot(-x, n) for x < 0
+    """
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("n must be a positive integer")
+    if x < 0:
+        if not n & 1:
+            raise ValueError("even root of a negative number")
+        return -iroot(-x, n)
+    if x < 2 or n == 1:
+        return x
+    if n == 2:
+        return math.isqrt(x)
+    # Start above the root; Newton's iterates then fall monotonically.
+    y = 1 << -(-x.bit_length() // n)
+    while True:
+        z = ((n - 1) * y + x // y ** (n - 1)) // n
+        if z >= y:
+            return y
+        y = z
+
+
+def is_perfect_power(x):
+    """Return (base, exp) with the largest exp > 1 such that
+    base ** exp == x, or False if x is not a perfect power."""
+    if x < 0:
+        power = is_perfect_power(-x)
+        if not power:
+            return False
+        base, exp = power
+        while not exp & 1:
+            base, exp = base * base, exp // 2
+        return (-base, exp) if exp > 1 else False
+    if x < 2:
+        return x, 2
+    for k in Sieve(x.bit_length()):
+        r = iroot(x, k)
+        if r ** k == x:
+            power = is_perfect_power(r)
+            return (power[0], power[1] * k) if power else (r, k)
+    return False
+
+
+def _ratio(x):
+    if isinstance(x, Fraction):
+        return x.numer, x.denom
+    if isinstance(x, int):
+        return x, 1
+    return x.as_integer_ratio()
+
+
+def root(x, n=2, digits=50, fraction=False):
+    """
+    Return the nth root of x truncated to a number of decimal places
+    :param x: int, float, Decimal or Fraction radicand
+    :param n: positive root
+    :param digits: decimal places to compute exactly
+    :param fraction: return a Fraction instead of a Decimal
+    :return: Decimal (or Fraction) within 10^-digits of x ** (1/n)
+    """
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("n must be a positive integer")
+    numer, denom = _ratio(x)
+    if numer < 0 and not n & 1:
+        raise ValueError("even root of a negative number")
+    r = iroot(abs(numer) * 10 ** (n * digits) // denom, n)
+    if numer < 0:
+        r = -r
+    if fraction:
+        return Fraction(r, 10 ** digits)
+    return Decimal(r).scaleb(-digits, Context(prec=MAX_PREC))
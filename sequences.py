@@ -1,5 +1,5 @@
 from zmath.core import floatint, floatfrac, eachtofloat,\
-    sigma, zsum, fibonacci, fib
+    sigma, fibonacci, fib
 from zmath.fraction import Fraction
 
 
@@ -64,14 +64,17 @@ class Arithmetic(Sequence):
 
     def _sequence(self):
         seq = []
-        a = self.a - self.d
+        a, d = floatfrac(self.a), floatfrac(self.d)
+        # a + k * d over the common denominator, in exact integers
+        denom = a.denom * d.denom
+        numer, step = a.numer * d.denom, d.numer * a.denom
         for _ in range(self.n):
-            a += self.d
-            seq.append(Fraction(a))
+            seq.append(Fraction(numer, denom))
+            numer += step
         return seq
 
     def series(self):
-        return Fraction(self.n * float(self.a + self.an) / 2)
+        return (self.seq[0] + self.an) * self.n / 2
 
 
 class Harmonic(Sequence):
@@ -98,12 +101,13 @@ class Harmonic(Sequence):
 
     def _sequence(self):
         seq = []
+        d = floatfrac(self.d)
         for n in range(self.a, self. a + self.n):
-            seq.append(Fraction(1 / (self.d * n)))
+            seq.append(Fraction(d.denom, d.numer * n))
         return seq
 
     def series(self):
-        return Fraction(zsum(eachtofloat(self.seq)))
+        return Fraction.sum(self.seq)
 
 
 class Geometric(Sequence):
@@ -130,14 +134,19 @@ class Geometric(Sequence):
 
     def _sequence(self):
         seq = []
-        a = self.a / self.d
+        a, r = floatfrac(self.a), floatfrac(self.d)
+        numer, denom = a.numer, a.denom
         for _ in range(self.n):
-            a *= self.d
-            seq.append(Fraction(a))
+            seq.append(Fraction(numer, denom))
+            numer *= r.numer
+            denom *= r.denom
         return seq
 
     def series(self):
-        return Fraction((self.a * (1 - self.d ** self.n)) / (1 - self.d))
+        a, r = floatfrac(self.a), floatfrac(self.d)
+        if r.numer == r.denom:
+            return a * self.n
+        return a * (1 - r ** self.n) / (1 - r)
 
 
 class Power(Sequence):
@@ -163,11 +172,14 @@ class Power(Sequence):
     def _sequence(self):
         seq = []
         for i in range(self.a, self.a + self.n):
-            seq.append(Fraction(pow(i, self.d)))
+            if isinstance(self.d, int):
+                seq.append(Fraction(i) ** self.d)
+            else:
+                seq.append(floatfrac(pow(i, self.d)))
         return seq
 
     def series(self):
-        return Fraction(zsum(self.seq))
+        return Fraction.sum(self.seq)
 
 
 class Triangular:
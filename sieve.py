@@ -0,0 +1,252 @@
+from array import array
+from bisect import bisect_right
+from itertools import compress
+
+_SEGMENT = 1 << 20  # odd numbers sieved per pass; a multiple of 8 * _BLOCK
+_BLOCK = 1 << 12    # bytes of bitset between two running prime counts
+
+_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_ASCII = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def _small_odd_primes(limit):
+    """Return the odd primes up to limit with a plain bytearray sieve."""
+    if limit < 3:
+        return []
+    sieve = bytearray([1]) * ((limit + 1) // 2)
+    sieve[0] = 0
+    for i in range(1, (int(limit ** 0.5) + 1) // 2 + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            sieve[start::p] = bytes(len(range(start, len(sieve), p)))
+    return [2 * i + 1 for i in compress(range(len(sieve)), sieve)]
+
+
+def _pack(flags):
+    """Pack a bytearray of 0/1 flags into a little-endian bitset."""
+    nbytes = (len(flags) + 7) // 8
+    if not nbytes:
+        return b''
+    value = int(flags.translate(_TO_ASCII)[::-1], 2)
+    return value.to_bytes(nbytes, 'little')
+
+
+def _unpack(bits, nflags):
+    """Inverse of _pack: return nflags 0/1 flags from a bitset."""
+    value = int.from_bytes(bits, 'little')
+    return format(value, '0{}b'.format(nflags))[::-1].encode() \
+        .translate(_FROM_ASCII)[:nflags]
+
+
+def sieve_segment(lo, hi, base):
+    """Return the packed bitset for the odd numbers 2 * i + 1 with
+    lo <= i < hi, where lo is a multiple of 8 and base holds the odd
+    primes up to the square root of 2 * hi."""
+    seg = bytearray([1]) * (hi - lo)
+    if lo == 0:
+        seg[0] = 0
+    for p in base:
+        start = p * p // 2
+        if start >= hi:
+            break
+        if start < lo:
+            start = lo + (-(2 * lo + 1 - p) // 2) % p
+        seg[start - lo::p] = bytes(len(range(start - lo, hi - lo, p)))
+    return _pack(seg)
+
+
+def block_counts(packed, running=0):
+    """Return the running prime counts after each _BLOCK bytes of a
+    bitset, starting from running."""
+    counts = []
+    for i in range(0, len(packed), _BLOCK):
+        running += int.from_bytes(packed[i:i + _BLOCK], 'little').bit_count()
+        counts.append(running)
+    return counts
+
+
+class Sieve:
+    """
+    Description:
+        A compact, in-memory table of the primes up to a limit.
+        Only odd numbers are stored, one bit each, so the table costs
+        about limit / 16 bytes.
+    Attributes:
+        limit - the largest number covered by the sieve
+    Methods:
+        is_prime - True if n is a prime
+        count - the number of primes <= n
+        nth - the kth prime, counting 2 as the first
+        primes - generate the primes in [start, stop)
+    """
+
+    def __init__(self, limit):
+        if limit < 0:
+            raise ValueError("limit must be non-negative")
+        self.limit = limit
+        # Bit i stands for the odd number 2 * i + 1.
+        self._size = (limit + 1) // 2
+        self._bits = bytearray()
+        self._counts = array('Q', [0])
+        base = _small_odd_primes(int(limit ** 0.5))
+        for lo in range(0, self._size, _SEGMENT):
+            self._sieve_segment(lo, min(lo + _SEGMENT, self._size), base)
+
+    def _sieve_segment(self, lo, hi, base):
+        packed = sieve_segment(lo, hi, base)
+        self._counts.extend(block_counts(packed, self._counts[-1]))
+        self._bits += packed
+
+    def __repr__(self):
+        return "Sieve({})".format(self.limit)
+
+    def __len__(self):
+        return self.count(self.limit)
+
+    def __contains__(self, n):
+        return self.is_prime(n)
+
+    def __iter__(self):
+        return self.primes(2, self.limit + 1)
+
+    def _check(self, n):
+        if n > self.limit:
+            raise ValueError("{} is beyond the sieve limit {}"
+                             .format(n, self.limit))
+
+    def is_prime(self, n):
+        """Return True if n is a prime, False otherwise."""
+        self._check(n)
+        if n < 3:
+            return n == 2
+        if not n & 1:
+            return False
+        i = n >> 1
+        return bool(self._bits[i >> 3] >> (i & 7) & 1)
+
+    def count(self, n):
+        """Return the number of primes less than or equal to n."""
+        self._check(n)
+        if n < 2:
+            return 0
+        flags = (n + 1) // 2
+        nbytes, nbits = divmod(flags, 8)
+        block = nbytes // _BLOCK
+        total = self._counts[block] + 1
+        view = memoryview(self._bits)[block * _BLOCK:nbytes]
+        total += int.from_bytes(view, 'little').bit_count()
+        if nbits:
+            total += (self._bits[nbytes] & ((1 << nbits) - 1)).bit_count()
+        return total
+
+    def _block_of(self, k):
+        """Return the block holding the kth odd prime."""
+        return bisect_right(self._counts, k - 1) - 1
+
+    def nth(self, k):
+        """Return the kth prime (nth(1) == 2)."""
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        if k == 1:
+            return 2
+        k -= 1
+        if k > self._counts[-1]:
+            raise ValueError("the sieve holds only {} primes"
+                             .format(self._counts[-1] + 1))
+        block = self._block_of(k)
+        k -= self._counts[block]
+        pos = block * _BLOCK
+        while True:
+            ones = self._bits[pos].bit_count()
+            if k <= ones:
+                break
+            k -= ones
+            pos += 1
+        byte = self._bits[pos]
+        for bit in range(8):
+            if byte >> bit & 1:
+                k -= 1
+                if not k:
+                    return 2 * (8 * pos + bit) + 1
+
+    def primes(self, start=2, stop=None):
+        """Generate the primes in the half-open range [start, stop)."""
+        stop = self.limit + 1 if stop is None else min(stop, self.limit + 1)
+        if start <= 2 < stop:
+            yield 2
+        lo = max(start, 3) // 2
+        hi = stop // 2
+        for first in range(lo - lo % 8, hi, 8 * _BLOCK):
+            last = min(first + 8 * _BLOCK, hi)
+            flags = _unpack(self._bits[first // 8:(last + 7) // 8],
+                            last - first)
+            begin = max(lo - first, 0)
+            yield from compress(range(2 * (first + begin) + 1,
+                                      2 * last + 1, 2), flags[begin:])
+
+
+class SPFTable:
+    """
+    Description:
+        Smallest-prime-factor index for the integers 0..limit, held in an
+        array('I'). Any n within the table factors in O(log n) steps.
+    Attributes:
+        limit - the largest number covered by the table
+    Methods:
+        grow - extend the table to cover a larger limit
+        is_prime - True if n is a prime
+        factorize - the prime factorization of n as {prime: exponent}
+    """
+
+    def __init__(self, limit=0):
+        self.limit = -1
+        self._spf = array('I')
+        self.grow(limit)
+
+    def __repr__(self):
+        return "SPFTable({})".format(self.limit)
+
+    def __getitem__(self, n):
+        return self._spf[n]
+
+    def grow(self, limit):
+        """Rebuild the table up to limit if it does not reach it yet."""
+        if limit <= self.limit:
+            return
+        if limit >= 1 << 32:
+            raise ValueError("limit must be below 2^32")
+        spf = array('I', range(limit + 1))
+        # Larger primes first, so the smallest prime factor is written last.
+        for p in reversed([2] + _small_odd_primes(int(limit ** 0.5))):
+            count = len(range(p * p, limit + 1, p))
+            spf[p * p::p] = array('I', [p]) * count
+        self._spf = spf
+        self.limit = limit
+
+    def is_prime(self, n):
+        """Return True if n is a prime, False otherwise."""
+        return n > 1 and self._spf[n] == n
+
+    def factorize(self, n):
+        """Return the prime factorization of 1 <= n <= limit."""
+        factors = {}
+        spf = self._spf
+        while n > 1:
+            p = spf[n]
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        return factors
+
+
+SPF_LIMIT = 1 << 16  # the shared SPFTable grows lazily up to this bound
+_spf_table = SPFTable()
+
+
+def spf_table(limit=None):
+    """Return the process-wide SPFTable, grown (at least doubling) to
+    cover limit, or SPF_LIMIT by default."""
+    limit = SPF_LIMIT if limit is None else limit
+    if limit > _spf_table.limit:
+        _spf_table.grow(max(limit, min(2 * _spf_table.limit, SPF_LIMIT)))
+    return _spf_table
@@ -1,6 +1,6 @@
 # from pprint import pprint
+from collections import Counter
 from zmath.core import prod, zsum, floatint
-from dictionary import count_items
 from operator import itemgetter
 
 
@@ -47,7 +47,7 @@ def mode(numbers):
 
 def mode2(numbers):
     """Return the most occurring number from numbers."""
-    return max(count_items(numbers).items(), key=itemgetter(1, 0))[0]
+    return max(Counter(numbers).items(), key=itemgetter(1, 0))[0]
 
 
 def median(numbers):
@@ -0,0 +1,50 @@
+import unittest
+
+from zmath.core import _numpy
+from zmath.expression import Expression, parse
+
+np = _numpy()
+
+
+class ParseTest(unittest.TestCase):
+
+    def test_empty_parentheses(self):
+        for source in ('()', '(())', ''):
+            with self.assertRaises(ValueError):
+                parse(source)
+
+
+class ColumnsTest(unittest.TestCase):
+
+    def test_list_columns_broadcast_scalars(self):
+        expr = Expression('x * y + 3')
+        self.assertEqual(expr.columns(x=[1, 2], y=5), [8, 13])
+        self.assertEqual(expr.columns(x=[1, 2], y=[3, 4]), [6, 11])
+
+    def test_list_columns_match_call(self):
+        expr = Expression('x ^ 2')
+        self.assertEqual(expr.columns(x=[2 ** 40]), [expr(x=2 ** 40)])
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_array_columns_broadcast_scalars(self):
+        expr = Expression('x * y + 3')
+        self.assertEqual(expr.columns(x=np.array([1, 2]), y=5).tolist(),
+                         [8, 13])
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_array_columns_do_not_wrap(self):
+        expr = Expression('x ^ 2')
+        self.assertEqual(expr.columns(x=np.array([2 ** 40, 3])).tolist(),
+                         [expr(x=2 ** 40), 9])
+        small = np.array([100], dtype=np.int8)
+        self.assertEqual(expr.columns(x=small).tolist(), [10000])
+
+    @unittest.skipIf(np is None, "requires numpy")
+    def test_array_columns_stay_native_when_safe(self):
+        result = Expression('x * y - 1').columns(x=np.arange(5), y=7)
+        self.assertEqual(result.dtype, np.int64)
+        self.assertEqual(result.tolist(), [-1, 6, 13, 20, 27])
+
+
+if __name__ == "__main__":
+    unittest.main()
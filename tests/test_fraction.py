@@ -0,0 +1,28 @@
+import unittest
+
+from zmath.fraction import Fraction
+
+
+class ZeroDenominatorTest(unittest.TestCase):
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(1, 0)
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(0.5, 0)
+
+    def test_setter_raises(self):
+        f = Fraction(1, 2)
+        with self.assertRaises(ZeroDivisionError):
+            f.denom = 0
+        self.assertEqual((f.numer, f.denom), (1, 2))
+
+    def test_division_raises(self):
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(1, 2) / 0
+        with self.assertRaises(ZeroDivisionError):
+            1 / Fraction(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
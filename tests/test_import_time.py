@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# seconds of cumulative import time allowed per module; -B keeps the
+# source tree clean, so this includes compiling zmath's modules
+_BUDGET = 0.05
+_scratch = None
+
+
+def setUpModule():
+    global _scratch
+    _scratch = tempfile.TemporaryDirectory()
+
+
+def tearDownModule():
+    _scratch.cleanup()
+
+
+def _path():
+    """Return a directory from which the checkout imports as zmath,
+    whatever the checkout directory is called."""
+    if os.path.basename(_ROOT) == "zmath":
+        return os.path.dirname(_ROOT)
+    link = os.path.join(_scratch.name, "zmath")
+    if not os.path.exists(link):
+        try:
+            os.symlink(_ROOT, link, target_is_directory=True)
+        except OSError:
+            raise unittest.SkipTest("can't import the checkout as zmath")
+    return _scratch.name
+
+
+def _run(code):
+    """Run code in a fresh interpreter that imports the checkout as
+    zmath, and return its stdout and stderr. It runs outside the
+    package, so that zmath.numbers cannot shadow the standard library,
+    and writes no bytecode."""
+    path = _path()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (path, env.get("PYTHONPATH"))))
+    done = subprocess.run([sys.executable, "-B", "-X", "importtime",
+                           "-c", code],
+                          cwd=_scratch.name, env=env,
+                          capture_output=True, text=True, check=True)
+    return done.stdout, done.stderr
+
+
+def _modules(code):
+    """Return the names of the modules loaded after running code."""
+    out, _ = _run(code + "; import sys; print(*sys.modules, sep='\\n')")
+    return out.splitlines()
+
+
+def _import_time(name):
+    """Return the cumulative import time of module name in seconds, as
+    reported by python -X importtime."""
+    _, report = _run("import " + name)
+    for line in report.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == name:
+            return int(fields[1]) / 1e6
+    raise AssertionError("no import time reported for " + name)
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_imports_this_checkout(self):
+        out, _ = _run("import zmath; print(zmath.__file__)")
+        self.assertEqual(os.path.realpath(os.path.dirname(out.strip())),
+                         os.path.realpath(_ROOT))
+
+    def test_package_is_lazy(self):
+        loaded = _modules("import zmath")
+        self.assertNotIn("zmath.fraction", loaded)
+        self.assertNotIn("zmath.core", loaded)
+        self.assertNotIn("numpy", loaded)
+
+    def test_core_skips_numpy(self):
+        self.assertNotIn("numpy", _modules("import zmath.core"))
+
+    def test_import_budget(self):
+        for name in ("zmath", "zmath.core"):
+            # the best of a few runs, to ignore a cold disk cache
+            best = min(_import_time(name) for _ in range(3))
+            self.assertLess(best, _BUDGET, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
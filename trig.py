@@ -1,7 +1,7 @@
 import math
 
 from zmath.core import floatint
-from zmath.fraction import Fraction
+from zmath.fraction import floatfrac
 
 
 def unitcircle():
@@ -14,7 +14,7 @@ def unitcircle():
         cos = floatint(round(math.cos(math.pi / n), 2))
         tan = "Undefined" if cos == 0 else float(round(sin / cos, 2))
         tan = floatint(tan) if isinstance(tan, float) else tan
-        fraction = Fraction(1 / n).__str__(True)
+        fraction = floatfrac(1 / n).__str__(True)
         theta = "π/{0}".format(n) if n > 1 else "{}π".format(fraction)
         results = [theta, sin, cos, tan]
         print(''.join(str(r).ljust(10) for r in results))